@@ -22,9 +22,17 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
     SUPABASE_SERVICE_KEY: str = ""
+    DATABASE_URL: str = ""  # Direct Postgres DSN for asyncpg
+    DB_POOL_MIN_SIZE: int = 10
+    DB_POOL_MAX_SIZE: int = 25
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = 300.0  # seconds before idle connections are recycled
+    DB_STATEMENT_CACHE_SIZE: int = 2048  # Prepared statements cached per connection
+    DB_MAX_CACHED_STATEMENT_LIFETIME: int = 300  # seconds before a cached statement is re-prepared
     
     # Redis for caching and rate limiting
     REDIS_URL: str = "redis://localhost:6379"
+    REDIS_MAX_CONNECTIONS: int = 50  # Shared by middleware, services and startup probes
+    REDIS_POOL_TIMEOUT: int = 5  # Seconds to wait for a free connection
     
     # CORS
     ALLOWED_ORIGINS: List[str] = [
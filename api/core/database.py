@@ -2,12 +2,19 @@
 Database connection and utilities using Supabase
 """
 
+from fastapi import HTTPException
 from supabase import create_client, Client
-from typing import Optional
+from typing import Iterable, List, Optional
+from uuid import UUID
 import asyncio
+import asyncpg
 from core.config import settings
 
 
+# Compares against the uuid primary key directly so the index is used
+GET_OWNED_ACCOUNT_IDS_SQL = "SELECT id::text AS id FROM accounts WHERE user_id = $1 AND id = ANY($2::uuid[])"
+
+
 class SupabaseClient:
     def __init__(self):
         self.client: Optional[Client] = None
@@ -36,13 +43,54 @@ class SupabaseClient:
             raise Exception("Supabase client not initialized")
 
 
-# Global instance
+class PostgresPool:
+    def __init__(self):
+        self.pool: Optional[asyncpg.Pool] = None
+    
+    async def connect(self):
+        """Initialize asyncpg pool (skipped when DATABASE_URL is not set)"""
+        if not settings.DATABASE_URL or self.pool:
+            return
+        
+        # asyncpg prepares every query and keeps it in a per-connection LRU,
+        # so repeated literal SQL skips parse/plan after the first call
+        self.pool = await asyncpg.create_pool(
+            settings.DATABASE_URL,
+            min_size=settings.DB_POOL_MIN_SIZE,
+            max_size=settings.DB_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+            statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+            max_cached_statement_lifetime=settings.DB_MAX_CACHED_STATEMENT_LIFETIME
+        )
+        print("✅ Postgres pool ready")
+    
+    async def close(self):
+        """Close asyncpg pool"""
+        if self.pool:
+            await self.pool.close()
+            self.pool = None
+    
+    def get_pool(self) -> asyncpg.Pool:
+        """Get asyncpg pool"""
+        if not self.pool:
+            raise Exception("Postgres pool not initialized")
+        return self.pool
+
+
+# Global instances
 db = SupabaseClient()
+pg = PostgresPool()
 
 
 async def init_db():
     """Initialize database connection"""
     await db.connect()
+    await pg.connect()
+
+
+async def close_db():
+    """Close database connections"""
+    await pg.close()
 
 
 def get_db() -> Client:
@@ -52,4 +100,41 @@ def get_db() -> Client:
 
 def get_service_db() -> Client:
     """Dependency to get service database client (for admin operations)"""
-    return db.get_client(service=True)
\ No newline at end of file
+    return db.get_client(service=True)
+
+
+async def get_pg():
+    """Dependency to get a pooled Postgres connection"""
+    # Without DATABASE_URL the pool is never created; report the endpoint
+    # as unavailable instead of failing with a bare 500
+    if not pg.pool:
+        raise HTTPException(status_code=503, detail="Database not configured")
+    async with pg.pool.acquire() as connection:
+        yield connection
+
+
+async def run_with_pg(job, *args):
+    """Run a DB helper on its own pooled connection (for background tasks)"""
+    if not pg.pool:
+        print(f"Skipping {job.__name__}: Postgres pool not initialized")
+        return None
+    async with pg.pool.acquire() as connection:
+        return await job(connection, *args)
+
+
+def valid_uuids(values: Iterable[str]) -> List[str]:
+    """Distinct values that parse as UUIDs (others can't match a uuid column)"""
+    valid = []
+    for value in set(values):
+        try:
+            UUID(value)
+        except (TypeError, ValueError):
+            continue
+        valid.append(value)
+    return valid
+
+
+async def batch_verify_account_ownership(db, account_ids: List[str], user_id: str) -> set:
+    """Return the subset of account IDs owned by the user"""
+    rows = await db.fetch(GET_OWNED_ACCOUNT_IDS_SQL, user_id, valid_uuids(account_ids))
+    return {row["id"] for row in rows}
@@ -0,0 +1,22 @@
+"""
+Shared async Redis client for caching and coordination
+"""
+
+import redis.asyncio as aioredis
+from core.config import settings
+
+
+# Connections are opened lazily on first command; once all are in use,
+# callers wait up to REDIS_POOL_TIMEOUT seconds for one to be released
+# instead of failing immediately with "Too many connections"
+pool = aioredis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT,
+    decode_responses=True
+)
+
+
+def get_redis() -> aioredis.Redis:
+    """Get Redis client backed by the shared connection pool"""
+    return aioredis.Redis(connection_pool=pool)
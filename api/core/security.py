@@ -15,6 +15,9 @@ import hmac
 
 security = HTTPBearer()
 
+# Keyed once at import; each verification works on a copy of this state
+_WEBHOOK_HMAC = hmac.new(settings.WEBHOOK_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -75,15 +78,22 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Security(
         )
 
 
+def new_webhook_hmac():
+    """Fresh HMAC for incrementally hashing a webhook payload"""
+    return _WEBHOOK_HMAC.copy()
+
+
+def verify_webhook_digest(mac, signature: str) -> bool:
+    """Compare a fed webhook HMAC against the received signature"""
+    return hmac.compare_digest(signature, mac.hexdigest())
+
+
 def verify_webhook_signature(payload: bytes, signature: str) -> bool:
     """Verify webhook signature"""
-    expected_signature = hmac.new(
-        settings.WEBHOOK_SECRET.encode('utf-8'),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
+    mac = new_webhook_hmac()
+    mac.update(payload)
     
-    return hmac.compare_digest(signature, expected_signature)
+    return verify_webhook_digest(mac, signature)
 
 
 def require_permissions(required_permissions: list):
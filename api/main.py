@@ -5,6 +5,7 @@ Una API completa para gestión financiera inteligente con automatización y aná
 
 from fastapi import FastAPI, HTTPException, Depends, Security
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
@@ -29,7 +30,7 @@ from routers import (
 
 # Import middleware and dependencies
 from core.config import settings
-from core.database import init_db
+from core.database import init_db, close_db
 from middleware.rate_limit import RateLimitMiddleware
 from middleware.logging import LoggingMiddleware
 
@@ -39,9 +40,12 @@ async def lifespan(app: FastAPI):
     """Lifecycle events for startup and shutdown"""
     # Startup
     await init_db()
+    # Build the OpenAPI document (and every model schema) before serving
+    app.openapi()
     print("🚀 Finance Garden API starting up...")
     yield
     # Shutdown
+    await close_db()
     print("📊 Finance Garden API shutting down...")
 
 
@@ -90,6 +94,7 @@ app = FastAPI(
         "url": "https://opensource.org/licenses/MIT",
     },
     terms_of_service="https://finance-garden.com/terms",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
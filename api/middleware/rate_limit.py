@@ -5,16 +5,12 @@ Rate limiting middleware using Redis
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 import time
-import redis
 import json
 from core.config import settings
+from core.redis import get_redis
 from typing import Callable
 
 
-# Redis client for rate limiting
-redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
-
-
 class RateLimitMiddleware:
     def __init__(self, app):
         self.app = app
@@ -71,18 +67,22 @@ class RateLimitMiddleware:
             current_time = int(time.time())
             window_start = current_time - settings.RATE_LIMIT_PERIOD
             
-            # Remove old entries
-            redis_client.zremrangebyscore(key, 0, window_start)
+            redis_client = get_redis()
             
-            # Count current requests
-            request_count = redis_client.zcard(key)
+            # Remove old entries and count current requests in one round trip
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.zremrangebyscore(key, 0, window_start)
+            pipe.zcard(key)
+            _, request_count = await pipe.execute()
             
             if request_count >= settings.RATE_LIMIT_REQUESTS:
                 return False
             
             # Add current request
-            redis_client.zadd(key, {str(current_time): current_time})
-            redis_client.expire(key, settings.RATE_LIMIT_PERIOD)
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.zadd(key, {str(current_time): current_time})
+            pipe.expire(key, settings.RATE_LIMIT_PERIOD)
+            await pipe.execute()
             
             return True
             
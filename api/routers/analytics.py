@@ -10,8 +10,6 @@ from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict, Any
 import pandas as pd
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.cluster import KMeans
 
 from schemas.analytics import (
     AnalyticsRequest, AnalyticsResponse, TrendAnalysis, 
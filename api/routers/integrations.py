@@ -166,37 +166,39 @@ async def import_from_csv(
     file_processor = FileProcessor()
     integration_service = IntegrationService(db, current_user["id"])
     
-    # Read and process CSV
-    content = await file.read()
-    df = pd.read_csv(io.StringIO(content.decode('utf-8')))
-    
-    # Auto-detect or use provided mapping
+    # Auto-detect or use provided mapping (detection only needs the header)
     if mapping:
         import json
-        column_mapping = ImportMapping(**json.loads(mapping))
+        column_mapping = ImportMapping(**json.loads(mapping)).model_dump()
     else:
-        column_mapping = await file_processor.auto_detect_columns(df)
+        column_mapping = await file_processor.auto_detect_columns(pd.read_csv(file.file, nrows=0))
+        file.file.seek(0)
     
-    # Process transactions
-    processed_data = await file_processor.process_csv_data(df, column_mapping)
+    # Process transactions in chunks straight from the upload
+    batches = file_processor.iter_csv(file.file, column_mapping)
     
     if preview_only:
+        preview = []
+        total_rows = 0
+        async for batch in batches:
+            preview.extend(batch[:10 - len(preview)])  # First 10 rows
+            total_rows += len(batch)
+        
         return {
             "status": "success",
             "message": "CSV preview generated",
-            "preview": processed_data[:10],  # First 10 rows
-            "total_rows": len(processed_data),
-            "detected_mapping": column_mapping.dict()
+            "preview": preview,
+            "total_rows": total_rows,
+            "detected_mapping": column_mapping
         }
     
     # Import to database
-    import_result = await integration_service.import_transactions(
-        processed_data, account_id
+    import_result = await integration_service.import_transaction_batches(
+        batches, account_id
     )
     
     return {
-        "status": "success",
-        "message": "CSV imported successfully",
+        **import_outcome(import_result, "CSV"),
         "imported": import_result["imported"],
         "duplicates": import_result["duplicates"],
         "errors": import_result["errors"]
@@ -244,7 +246,7 @@ async def import_from_excel(
             "preview": processed_data[:10],
             "total_rows": len(processed_data),
             "sheet_names": file_processor.get_sheet_names(io.BytesIO(content)),
-            "detected_mapping": column_mapping.dict()
+            "detected_mapping": column_mapping
         }
     
     # Import to database
@@ -253,8 +255,7 @@ async def import_from_excel(
     )
     
     return {
-        "status": "success", 
-        "message": "Excel imported successfully",
+        **import_outcome(import_result, "Excel"),
         **import_result
     }
 
@@ -420,7 +421,7 @@ async def register_webhook(
 async def get_import_templates():
     file_processor = FileProcessor()
     
-    templates = await file_processor.get_import_templates()
+    templates = file_processor.get_import_templates()
     
     return {
         "status": "success",
@@ -469,6 +470,18 @@ async def connect_third_party(
     }
 
 
+# Helper functions
+def import_outcome(import_result: Dict[str, int], file_type: str) -> Dict[str, str]:
+    """Overall status of an import; fails outright when no row could be written"""
+    if not import_result["errors"]:
+        return {"status": "success", "message": f"{file_type} imported successfully"}
+    
+    if not import_result["imported"] and not import_result["duplicates"]:
+        raise HTTPException(status_code=500, detail=f"{file_type} import failed")
+    
+    return {"status": "partial", "message": f"{file_type} imported with errors"}
+
+
 # Background task functions
 async def perform_bank_sync(connection_id: str, user_id: str, days_back: int = 30):
     """Background task for bank synchronization"""
@@ -3,14 +3,19 @@
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from datetime import datetime, date
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from datetime import datetime, date, time, timedelta, timezone
+from typing import AsyncIterator, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
 from enum import Enum
+from secrets import token_hex
+import orjson
+from redis.exceptions import RedisError
 
 from schemas.base import BaseResponse, CurrencyAmount, PaginationParams, FilterParams
 from core.security import get_current_user
-from core.database import get_db
+from core.database import batch_verify_account_ownership, get_pg
+from core.redis import get_redis
 
 router = APIRouter()
 
@@ -73,11 +78,11 @@ class PaymentResponse(BaseModel):
     payment_method: PaymentMethod
     status: PaymentStatus
     account_id: str
-    account_name: Optional[str]
+    account_name: Optional[str] = None
     recipient_name: Optional[str]
     recipient_account: Optional[str]
     category_id: Optional[str]
-    category_name: Optional[str]
+    category_name: Optional[str] = None
     scheduled_date: Optional[datetime]
     processed_date: Optional[datetime]
     reference: Optional[str]
@@ -90,11 +95,63 @@ class PaymentResponse(BaseModel):
     updated_at: datetime
 
 
+# Seconds the Redis schedule index lives before it is rebuilt from the
+# database, so drift from writes that bypass this router heals on its own
+SCHEDULE_INDEX_TTL = 300
+
+# Validates whole result lists in one pass instead of one model per row
+_PAYMENT_LIST_ADAPTER = TypeAdapter(List[PaymentResponse])
+
+# Hot single-row queries kept as literal constants so asyncpg's
+# per-connection statement cache reuses the prepared plan
+LIST_PAYMENTS_SQL = """
+    SELECT p.*, a.name AS account_name, c.name AS category_name
+    FROM payments p
+    LEFT JOIN accounts a ON a.id = p.account_id
+    LEFT JOIN categories c ON c.id = p.category_id
+"""
+GET_PAYMENT_SQL = LIST_PAYMENTS_SQL + "    WHERE p.id = $1 AND p.user_id = $2"
+UPDATE_PAYMENT_STATUS_SQL = "UPDATE payments SET status = $2, updated_at = NOW() WHERE id = $1"
+GET_PAYMENTS_BY_IDS_SQL = LIST_PAYMENTS_SQL + """
+    WHERE p.id = ANY($1::text[]) AND p.user_id = $2 AND p.status = 'pending'
+"""
+GET_SCHEDULED_PAYMENTS_SQL = LIST_PAYMENTS_SQL + """
+    WHERE p.user_id = $1 AND p.status = 'pending' AND p.scheduled_date >= NOW()
+    ORDER BY p.scheduled_date
+"""
+
+# Name joins are applied to the updated row so the response matches a GET
+UPDATE_PAYMENT_SQL = """
+    WITH p AS (
+        UPDATE payments SET {}, updated_at = NOW()
+        WHERE id = $1 AND user_id = $2
+        RETURNING *
+    )
+    SELECT p.*, a.name AS account_name, c.name AS category_name
+    FROM p
+    LEFT JOIN accounts a ON a.id = p.account_id
+    LEFT JOIN categories c ON c.id = p.category_id
+"""
+
+# Optional list filters -> parameterized WHERE fragments
+PAYMENT_FILTER_CLAUSES = {
+    "status": "p.status = ${}",
+    "payment_method": "p.payment_method = ${}",
+    "account_id": "p.account_id = ${}",
+    "category_id": "p.category_id = ${}",
+    "min_amount": "p.amount >= ${}",
+    "max_amount": "p.amount <= ${}",
+    "start_date": "p.created_at >= ${}",
+    "end_date": "p.created_at <= ${}",
+    "search": "p.description ILIKE '%' || ${} || '%'",
+}
+
+
 @router.post("/", response_model=PaymentResponse, status_code=201)
 async def create_payment(
     payment: PaymentCreate,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     💳 Crear un nuevo pago
@@ -142,7 +199,7 @@ async def get_payments(
     min_amount: Optional[float] = Query(None, ge=0, description="Monto mínimo"),
     max_amount: Optional[float] = Query(None, gt=0, description="Monto máximo"),
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     📋 Listar pagos del usuario
@@ -164,16 +221,23 @@ async def get_payments(
         **filters.dict(exclude_none=True)
     }
     
-    payments = await get_payments_from_db(db, query_filters, pagination)
-    
-    return [PaymentResponse(**payment) for payment in payments]
+    # Rows are streamed from a server-side cursor so large histories
+    # never have to be materialized before the first byte is sent
+    stream = stream_payments_from_db(db, query_filters, pagination)
+    # Query and validate the first row before the response starts, so
+    # failures still surface as an error status instead of a cut-off body
+    first_chunk = await anext(stream)
+    return StreamingResponse(
+        prepend_chunk(first_chunk, stream),
+        media_type="application/json"
+    )
 
 
 @router.get("/{payment_id}", response_model=PaymentResponse)
 async def get_payment(
     payment_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     🔍 Obtener detalles de un pago específico
@@ -191,7 +255,7 @@ async def update_payment(
     payment_id: str,
     payment_update: PaymentUpdate,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     ✏️ Actualizar un pago
@@ -214,9 +278,16 @@ async def update_payment(
     
     # Update payment
     update_data = payment_update.dict(exclude_none=True)
-    update_data["updated_at"] = datetime.utcnow()
     
-    updated_payment = await update_payment_in_db(db, payment_id, update_data)
+    updated_payment = await update_payment_in_db(db, payment_id, current_user["id"], update_data)
+    if not updated_payment:
+        raise HTTPException(status_code=404, detail="Payment not found")
+    
+    # Keep the schedule index in sync with the new status and date
+    if update_data.get("status", PaymentStatus.PENDING) != PaymentStatus.PENDING:
+        await unschedule_payment(current_user["id"], payment_id)
+    elif "scheduled_date" in update_data:
+        await schedule_payment(current_user["id"], payment_id, update_data["scheduled_date"])
     
     return PaymentResponse(**updated_payment)
 
@@ -225,7 +296,7 @@ async def update_payment(
 async def cancel_payment(
     payment_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     ❌ Cancelar un pago
@@ -246,6 +317,7 @@ async def cancel_payment(
     
     # Cancel payment
     await update_payment_status(db, payment_id, PaymentStatus.CANCELLED)
+    await unschedule_payment(current_user["id"], payment_id)
     
     return {"status": "success", "message": "Payment cancelled successfully"}
 
@@ -254,7 +326,7 @@ async def cancel_payment(
 async def process_payment_manually(
     payment_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     ⚡ Procesar pago manualmente
@@ -262,19 +334,28 @@ async def process_payment_manually(
     Fuerza el procesamiento de un pago PENDING.
     Útil para pagos programados que se quieren ejecutar antes.
     """
-    payment = await get_payment_by_id(db, payment_id, current_user["id"])
-    
-    if not payment:
-        raise HTTPException(status_code=404, detail="Payment not found")
-    
-    if payment["status"] != PaymentStatus.PENDING:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Cannot process payment with status {payment['status']}"
-        )
-    
-    # Process payment
-    result = await process_payment(db, payment_id)
+    # Reject duplicate submissions while the first one is in flight
+    lock_key = f"proc-lock:{payment_id}"
+    await acquire_request_lock(lock_key, "Payment already being processed")
+    
+    try:
+        payment = await get_payment_by_id(db, payment_id, current_user["id"])
+        
+        if not payment:
+            raise HTTPException(status_code=404, detail="Payment not found")
+        
+        if payment["status"] != PaymentStatus.PENDING:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot process payment with status {payment['status']}"
+            )
+        
+        # Process payment
+        result = await process_payment(db, payment_id)
+        await unschedule_payment(current_user["id"], payment_id)
+    except Exception:
+        await release_request_lock(lock_key)
+        raise
     
     return {
         "status": "success",
@@ -290,7 +371,7 @@ async def refund_payment(
     refund_amount: Optional[float] = Query(None, description="Monto a reembolsar (opcional, por defecto el total)"),
     reason: Optional[str] = Query(None, description="Razón del reembolso"),
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     💸 Reembolsar un pago
@@ -319,8 +400,17 @@ async def refund_payment(
             detail="Refund amount cannot exceed original payment amount"
         )
     
+    # Block accidental double-submits of the same refund; distinct
+    # amounts are allowed through as separate partial refunds
+    lock_key = f"refund-lock:{payment_id}:{refund_amount}"
+    await acquire_request_lock(lock_key, "Refund already being processed")
+    
     # Process refund
-    refund_result = await process_refund(db, payment_id, refund_amount, reason)
+    try:
+        refund_result = await process_refund(db, payment_id, refund_amount, reason)
+    except Exception:
+        await release_request_lock(lock_key)
+        raise
     
     return {
         "status": "success",
@@ -335,7 +425,7 @@ async def refund_payment(
 async def get_upcoming_payments(
     days_ahead: int = Query(30, ge=1, le=365, description="Días hacia adelante"),
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     📅 Pagos programados próximos
@@ -350,7 +440,7 @@ async def get_upcoming_payments(
     
     return {
         "status": "success",
-        "upcoming_payments": [PaymentResponse(**p) for p in upcoming_payments],
+        "upcoming_payments": _PAYMENT_LIST_ADAPTER.validate_python(upcoming_payments),
         "total": len(upcoming_payments),
         "period_days": days_ahead
     }
@@ -360,7 +450,7 @@ async def get_upcoming_payments(
 async def create_bulk_payments(
     payments: List[PaymentCreate],
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     📦 Crear múltiples pagos en lote
@@ -376,10 +466,15 @@ async def create_bulk_payments(
     created_payments = []
     errors = []
     
+    # Validate account ownership for the whole batch in one query
+    owned_accounts = await batch_verify_account_ownership(
+        db, [payment.account_id for payment in payments], current_user["id"]
+    )
+    
     for i, payment in enumerate(payments):
         try:
-            # Validate account ownership
-            await verify_account_ownership(db, payment.account_id, current_user["id"])
+            if payment.account_id not in owned_accounts:
+                raise HTTPException(status_code=404, detail="Account not found")
             
             # Create payment
             payment_data = {
@@ -392,7 +487,7 @@ async def create_bulk_payments(
             }
             
             saved_payment = await save_payment(db, payment_data)
-            created_payments.append(PaymentResponse(**saved_payment))
+            created_payments.append(PaymentResponse.model_validate(saved_payment))
             
         except Exception as e:
             errors.append({
@@ -435,52 +530,160 @@ async def calculate_payment_fees(method: PaymentMethod, amount: float, currency:
 async def save_payment(db, payment_data: dict) -> dict:
     """Save payment to database"""
     # Mock implementation
+    if payment_data.get("scheduled_date"):
+        await schedule_payment(payment_data["user_id"], payment_data["id"], payment_data["scheduled_date"])
     return payment_data
 
 async def process_payment(db, payment_id: str) -> dict:
     """Process payment"""
     # Mock implementation
-    await update_payment_status(db, payment_id, PaymentStatus.COMPLETED)
     return {"transaction_id": f"txn_{generate_id()}"}
 
 async def update_payment_status(db, payment_id: str, status: PaymentStatus):
     """Update payment status"""
-    # Mock implementation
-    pass
-
-async def get_payments_from_db(db, filters: dict, pagination) -> List[dict]:
-    """Get payments from database"""
-    # Mock implementation
-    return []
-
-async def get_payment_by_id(db, payment_id: str, user_id: str) -> dict:
+    await db.execute(UPDATE_PAYMENT_STATUS_SQL, payment_id, status.value)
+
+def build_payments_query(filters: dict, pagination) -> tuple:
+    """Build parameterized payments list query"""
+    clauses = ["p.user_id = $1"]
+    args = [filters["user_id"]]
+    
+    for key, clause in PAYMENT_FILTER_CLAUSES.items():
+        value = filters.get(key)
+        if value is not None:
+            args.append(value.value if isinstance(value, Enum) else value)
+            clauses.append(clause.format(len(args)))
+    
+    args.extend([pagination.limit, pagination.offset])
+    query = (
+        f"{LIST_PAYMENTS_SQL}    WHERE {' AND '.join(clauses)} "
+        f"ORDER BY p.created_at DESC LIMIT ${len(args) - 1} OFFSET ${len(args)}"
+    )
+    return query, args
+
+async def stream_payments_from_db(db, filters: dict, pagination) -> AsyncIterator[bytes]:
+    """Stream payments from database as a JSON array"""
+    query, args = build_payments_query(filters, pagination)
+    
+    separator = b"["
+    async with db.transaction():
+        async for row in db.cursor(query, *args):
+            payment = PaymentResponse.model_validate(dict(row))
+            yield separator + orjson.dumps(payment.model_dump())
+            separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+async def prepend_chunk(first: bytes, rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Re-attach an already consumed first chunk to a byte stream"""
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+async def get_payment_by_id(db, payment_id: str, user_id: str) -> Optional[dict]:
     """Get payment by ID"""
-    # Mock implementation
-    return {
-        "id": payment_id,
-        "user_id": user_id,
-        "description": "Test Payment",
-        "amount": 100.0,
-        "currency": "USD",
-        "status": PaymentStatus.PENDING,
-        "payment_method": PaymentMethod.CARD,
-        "account_id": "acc_123",
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
-        "tags": []
-    }
-
-async def update_payment_in_db(db, payment_id: str, update_data: dict) -> dict:
-    """Update payment in database"""
-    # Mock implementation
-    payment = await get_payment_by_id(db, payment_id, "user_123")
-    payment.update(update_data)
-    return payment
+    row = await db.fetchrow(GET_PAYMENT_SQL, payment_id, user_id)
+    return dict(row) if row else None
+
+async def update_payment_in_db(db, payment_id: str, user_id: str, update_data: dict) -> Optional[dict]:
+    """Update payment in database and return it with its joined names"""
+    # Only user-editable columns are written; updated_at is set by the query
+    columns = [column for column in update_data if column in PaymentUpdate.model_fields]
+    if not columns:
+        return await get_payment_by_id(db, payment_id, user_id)
+    
+    assignments = ", ".join(f"{column} = ${i}" for i, column in enumerate(columns, start=3))
+    values = [
+        update_data[column].value if isinstance(update_data[column], Enum) else update_data[column]
+        for column in columns
+    ]
+    row = await db.fetchrow(UPDATE_PAYMENT_SQL.format(assignments), payment_id, user_id, *values)
+    return dict(row) if row else None
 
 async def get_scheduled_payments(db, user_id: str, end_date: date) -> List[dict]:
-    """Get scheduled payments"""
-    # Mock implementation
-    return []
+    """Get scheduled payments, served from the Redis schedule index when warm"""
+    key = f"sched:{user_id}"
+    # Write-through ZADDs can create the index before it is filled, so
+    # "warm" is tracked by a separate marker rather than the key itself
+    filled_key = f"sched-filled:{user_id}"
+    end_ts = schedule_score(datetime.combine(end_date, time.max))
+    payments = None
+    
+    try:
+        redis = get_redis()
+        if await redis.exists(filled_key):
+            payment_ids = await redis.zrangebyscore(key, datetime.now(timezone.utc).timestamp(), end_ts)
+            return await get_payments_by_ids(db, payment_ids, user_id)
+        
+        # Cache miss: load from the database and fill the index
+        payments = await get_scheduled_payments_from_db(db, user_id)
+        async with redis.pipeline(transaction=False) as pipe:
+            if payments:
+                pipe.zadd(key, {p["id"]: schedule_score(p["scheduled_date"]) for p in payments})
+                pipe.expire(key, SCHEDULE_INDEX_TTL)
+            pipe.set(filled_key, "1", ex=SCHEDULE_INDEX_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        print(f"Schedule index unavailable: {e}")
+        if payments is None:
+            payments = await get_scheduled_payments_from_db(db, user_id)
+    
+    return [p for p in payments if schedule_score(p["scheduled_date"]) <= end_ts]
+
+async def get_scheduled_payments_from_db(db, user_id: str) -> List[dict]:
+    """Get all upcoming scheduled payments from database"""
+    rows = await db.fetch(GET_SCHEDULED_PAYMENTS_SQL, user_id)
+    return [dict(row) for row in rows]
+
+async def get_payments_by_ids(db, payment_ids: List[str], user_id: str) -> List[dict]:
+    """Get payments by ID, preserving the given order"""
+    if not payment_ids:
+        return []
+    rows = await db.fetch(GET_PAYMENTS_BY_IDS_SQL, payment_ids, user_id)
+    by_id = {row["id"]: dict(row) for row in rows}
+    return [by_id[payment_id] for payment_id in payment_ids if payment_id in by_id]
+
+async def acquire_request_lock(key: str, detail: str, ttl: int = 30):
+    """Take a short-lived Redis lock or reject the request as a duplicate"""
+    try:
+        acquired = await get_redis().set(key, "1", nx=True, ex=ttl)
+    except RedisError as e:
+        # If Redis is down, allow the request
+        print(f"Request lock check failed: {e}")
+        return
+    
+    if not acquired:
+        raise HTTPException(status_code=429, detail=detail)
+
+async def release_request_lock(key: str):
+    """Release a Redis request lock"""
+    try:
+        await get_redis().delete(key)
+    except RedisError as e:
+        print(f"Request lock release failed: {e}")
+
+def schedule_score(moment: datetime) -> float:
+    """Epoch seconds for the schedule index (naive datetimes are UTC)"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+async def schedule_payment(user_id: str, payment_id: str, scheduled_date: datetime):
+    """Add payment to the user's Redis schedule index"""
+    key = f"sched:{user_id}"
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.zadd(key, {payment_id: schedule_score(scheduled_date)})
+            pipe.expire(key, SCHEDULE_INDEX_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        print(f"Schedule index update failed: {e}")
+
+async def unschedule_payment(user_id: str, payment_id: str):
+    """Remove payment from the user's Redis schedule index"""
+    try:
+        await get_redis().zrem(f"sched:{user_id}", payment_id)
+    except RedisError as e:
+        print(f"Schedule index update failed: {e}")
 
 async def process_refund(db, payment_id: str, amount: float, reason: str) -> dict:
     """Process refund"""
@@ -489,7 +692,4 @@ async def process_refund(db, payment_id: str, amount: float, reason: str) -> dic
 
 def generate_id() -> str:
     """Generate unique ID"""
-    import uuid
-    return str(uuid.uuid4())[:8]
-
-from datetime import timedelta
\ No newline at end of file
+    return token_hex(4)
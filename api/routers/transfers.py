@@ -2,18 +2,97 @@
 🔄 Transfers Router - CRUD operations for account transfers
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, date
 from typing import List, Optional
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
+from secrets import token_hex
+from aiodataloader import DataLoader
+import asyncio
 
 from schemas.base import BaseResponse, CurrencyAmount, PaginationParams, FilterParams
 from core.security import get_current_user
-from core.database import get_db
+from core.database import batch_verify_account_ownership, get_pg, run_with_pg, valid_uuids
+from services.cache_service import RedisCacheService
+from services.exchange_rate_service import ExchangeRateService
 
 router = APIRouter()
 
+# Max bulk items processed concurrently, kept below the DB pool size
+BULK_TRANSFER_CONCURRENCY = 10
+
+# Seconds an exchange rate is served from cache
+FX_RATE_TTL = 60
+
+GET_ACCOUNTS_BY_IDS_SQL = "SELECT id::text AS id, user_id::text AS user_id FROM accounts WHERE id = ANY($1::uuid[])"
+
+TRANSFER_INSERT_COLUMNS = (
+    "id", "user_id", "description", "amount", "currency", "status", "transfer_type",
+    "from_account_id", "to_account_id", "to_user_id", "to_account_number", "to_bank_code",
+    "to_routing_number", "recipient_name", "recipient_email", "recipient_phone",
+    "scheduled_date", "is_recurring", "frequency", "end_date", "reference", "notes", "tags",
+    "fees", "exchange_rate", "total_amount", "created_at", "updated_at"
+)
+INSERT_TRANSFER_SQL = "INSERT INTO transfers ({}) VALUES ({})".format(
+    ", ".join(TRANSFER_INSERT_COLUMNS),
+    ", ".join(f"${i}" for i in range(1, len(TRANSFER_INSERT_COLUMNS) + 1))
+)
+
+# Response fields a transfer doesn't have until it is joined or processed
+NEW_TRANSFER_DEFAULTS = {
+    "from_account_name": None,
+    "to_account_name": None,
+    "processed_date": None,
+    "next_execution": None,
+    "transaction_id": None
+}
+
+# Account names are joined in so the list endpoint stays a single query
+LIST_TRANSFERS_SQL = """
+    SELECT t.*, a1.name AS from_account_name, a2.name AS to_account_name
+    FROM transfers t
+    LEFT JOIN accounts a1 ON a1.id = t.from_account_id
+    LEFT JOIN accounts a2 ON a2.id = t.to_account_id
+"""
+
+# Hot per-transfer queries stay literal so asyncpg's statement cache reuses them
+GET_TRANSFER_SQL = LIST_TRANSFERS_SQL + "    WHERE t.id = $1 AND t.user_id = $2"
+UPDATE_TRANSFER_STATUS_SQL = "UPDATE transfers SET status = $2, updated_at = NOW() WHERE id = $1"
+
+# Name joins are applied to the updated row so the response matches a GET
+UPDATE_TRANSFER_SQL = """
+    WITH t AS (
+        UPDATE transfers SET {}, updated_at = NOW()
+        WHERE id = $1 AND user_id = $2
+        RETURNING *
+    )
+    SELECT t.*, a1.name AS from_account_name, a2.name AS to_account_name
+    FROM t
+    LEFT JOIN accounts a1 ON a1.id = t.from_account_id
+    LEFT JOIN accounts a2 ON a2.id = t.to_account_id
+"""
+
+GET_SCHEDULED_TRANSFERS_SQL = LIST_TRANSFERS_SQL + """
+    WHERE t.user_id = $1 AND t.status = 'scheduled' AND t.scheduled_date < $2::date + 1
+    ORDER BY t.scheduled_date
+"""
+
+# Optional list filters -> parameterized WHERE fragments
+TRANSFER_FILTER_CLAUSES = {
+    "status": "t.status = ${}",
+    "transfer_type": "t.transfer_type = ${}",
+    "from_account_id": "t.from_account_id = ${}",
+    "to_account_id": "t.to_account_id = ${}",
+    "is_recurring": "t.is_recurring = ${}",
+    "min_amount": "t.amount >= ${}",
+    "max_amount": "t.amount <= ${}",
+    "start_date": "t.created_at >= ${}",
+    "end_date": "t.created_at <= ${}",
+    "search": "t.description ILIKE '%' || ${} || '%'",
+}
+
 
 class TransferType(str, Enum):
     INTERNAL = "internal"  # Between user's own accounts
@@ -42,6 +121,24 @@ class TransferFrequency(str, Enum):
     YEARLY = "yearly"
 
 
+# Statuses that block edits / allow cancellation or manual execution
+LOCKED_TRANSFER_STATUSES = frozenset({TransferStatus.COMPLETED, TransferStatus.PROCESSING})
+CANCELLABLE_TRANSFER_STATUSES = frozenset({TransferStatus.PENDING, TransferStatus.SCHEDULED})
+
+TRANSFER_FEE_RATES = {
+    TransferType.INTERNAL: 0.0,  # Free internal transfers
+    TransferType.EXTERNAL: 0.015,  # 1.5%
+    TransferType.BANK: 0.005,  # 0.5%
+    TransferType.WALLET: 0.025,  # 2.5%
+    TransferType.INTERNATIONAL: 0.035  # 3.5%
+}
+
+TRANSFER_FLAT_FEES = {
+    TransferType.INTERNATIONAL: 5.0,  # $5 flat fee
+    TransferType.BANK: 2.0  # $2 flat fee
+}
+
+
 class TransferCreate(BaseModel):
     """Create transfer request"""
     description: str = Field(..., min_length=1, max_length=200, description="Descripción de la transferencia")
@@ -76,15 +173,14 @@ class TransferCreate(BaseModel):
     notes: Optional[str] = Field(None, max_length=500, description="Notas adicionales")
     tags: Optional[List[str]] = Field(default_factory=list, description="Etiquetas")
     
-    @validator('to_account_id', 'to_user_id', 'to_account_number')
-    def validate_destination(cls, v, values):
+    @model_validator(mode='after')
+    def validate_destination(self):
         """At least one destination must be provided"""
-        if 'transfer_type' in values:
-            if values['transfer_type'] == TransferType.INTERNAL and not values.get('to_account_id'):
-                raise ValueError('to_account_id required for internal transfers')
-            elif values['transfer_type'] == TransferType.EXTERNAL and not values.get('to_account_number'):
-                raise ValueError('to_account_number required for external transfers')
-        return v
+        if self.transfer_type == TransferType.INTERNAL and not self.to_account_id:
+            raise ValueError('to_account_id required for internal transfers')
+        elif self.transfer_type == TransferType.EXTERNAL and not self.to_account_number:
+            raise ValueError('to_account_number required for external transfers')
+        return self
 
 
 class TransferUpdate(BaseModel):
@@ -103,8 +199,14 @@ class TransferUpdate(BaseModel):
     status: Optional[TransferStatus] = None
 
 
+# Columns update_transfer may write: the editable fields plus recalculated costs
+TRANSFER_UPDATE_COLUMNS = (*TransferUpdate.model_fields, "fees", "total_amount")
+
+
 class TransferResponse(BaseModel):
     """Transfer response model"""
+    model_config = ConfigDict(use_enum_values=True)
+    
     id: str
     description: str
     amount: float
@@ -148,11 +250,25 @@ class TransferResponse(BaseModel):
     updated_at: datetime
 
 
+async def get_account_loader(db = Depends(get_pg)) -> DataLoader:
+    """Request-scoped loader that batches and dedupes account lookups"""
+    # async so FastAPI builds it on the event loop: DataLoader binds to the
+    # current loop and a sync dependency would run in a worker thread
+    async def load_accounts(account_ids: List[str]) -> List[Optional[dict]]:
+        rows = await db.fetch(GET_ACCOUNTS_BY_IDS_SQL, valid_uuids(account_ids))
+        accounts = {row["id"]: dict(row) for row in rows}
+        return [accounts.get(account_id) for account_id in account_ids]
+    
+    return DataLoader(load_accounts)
+
+
 @router.post("/", response_model=TransferResponse, status_code=201)
 async def create_transfer(
     transfer: TransferCreate,
+    background_tasks: BackgroundTasks,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg),
+    account_loader: DataLoader = Depends(get_account_loader)
 ):
     """
     🔄 Crear una nueva transferencia
@@ -163,12 +279,16 @@ async def create_transfer(
     - Bancaria: a/desde bancos tradicionales
     - Internacional: transferencias cross-border
     """
-    # Validate source account ownership
-    from_account = await verify_account_ownership(db, transfer.from_account_id, current_user["id"])
-    
-    # Validate destination for internal transfers
+    # Validate source account ownership, plus the destination for internal
+    # transfers; both lookups are batched into one query by the loader
+    account_ids = [transfer.from_account_id]
     if transfer.transfer_type == TransferType.INTERNAL:
-        to_account = await verify_account_ownership(db, transfer.to_account_id, current_user["id"])
+        account_ids.append(transfer.to_account_id)
+    
+    await asyncio.gather(*[
+        verify_account_ownership(account_loader, account_id, current_user["id"])
+        for account_id in account_ids
+    ])
     
     # Calculate fees and exchange rates
     fees, exchange_rate = await calculate_transfer_costs(
@@ -179,33 +299,37 @@ async def create_transfer(
     )
     
     # Create transfer record
-    transfer_data = {
-        **transfer.dict(),
-        "id": f"txf_{generate_id()}",
-        "user_id": current_user["id"],
-        "status": TransferStatus.SCHEDULED if transfer.scheduled_date else TransferStatus.PENDING,
-        "fees": fees,
-        "exchange_rate": exchange_rate,
-        "total_amount": transfer.amount + fees,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow()
-    }
+    now = datetime.utcnow()
+    transfer_data = {**NEW_TRANSFER_DEFAULTS, **transfer.model_dump()}
+    transfer_data.update(
+        id=f"txf_{generate_id()}",
+        user_id=current_user["id"],
+        status=TransferStatus.SCHEDULED if transfer.scheduled_date else TransferStatus.PENDING,
+        fees=fees,
+        exchange_rate=exchange_rate,
+        total_amount=transfer.amount + fees,
+        created_at=now,
+        updated_at=now
+    )
+    
+    # Validate the response before anything is written
+    created_transfer = TransferResponse.model_validate(transfer_data)
     
     # Save to database
     saved_transfer = await save_transfer(db, transfer_data)
     
-    # Process immediate transfers
+    # Processing and recurring setup run after the 201 is sent, each on
+    # its own pooled connection since the request's one is released
     if not transfer.scheduled_date:
-        await process_transfer(db, saved_transfer["id"])
+        background_tasks.add_task(run_with_pg, process_transfer, saved_transfer["id"])
     
-    # Setup recurring transfers
     if transfer.is_recurring:
-        await setup_recurring_transfer(db, saved_transfer["id"], transfer.frequency)
+        background_tasks.add_task(run_with_pg, setup_recurring_transfer, saved_transfer["id"], transfer.frequency)
     
-    return TransferResponse(**saved_transfer)
+    return created_transfer
 
 
-@router.get("/", response_model=List[TransferResponse])
+@router.get("/", response_model=List[TransferResponse], response_class=ORJSONResponse)
 async def get_transfers(
     pagination: PaginationParams = Depends(),
     filters: FilterParams = Depends(),
@@ -217,7 +341,7 @@ async def get_transfers(
     min_amount: Optional[float] = Query(None, ge=0, description="Monto mínimo"),
     max_amount: Optional[float] = Query(None, gt=0, description="Monto máximo"),
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     📋 Listar transferencias del usuario
@@ -234,19 +358,23 @@ async def get_transfers(
         "is_recurring": is_recurring,
         "min_amount": min_amount,
         "max_amount": max_amount,
-        **filters.dict(exclude_none=True)
+        **filters.model_dump(exclude_none=True)
     }
     
     transfers = await get_transfers_from_db(db, query_filters, pagination)
     
-    return [TransferResponse(**transfer) for transfer in transfers]
+    # Serialize once with orjson instead of re-validating through response_model
+    return ORJSONResponse([
+        TransferResponse.model_validate(transfer).model_dump(mode="json")
+        for transfer in transfers
+    ])
 
 
 @router.get("/{transfer_id}", response_model=TransferResponse)
 async def get_transfer(
     transfer_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     🔍 Obtener detalles de una transferencia específica
@@ -264,7 +392,7 @@ async def update_transfer(
     transfer_id: str,
     transfer_update: TransferUpdate,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     ✏️ Actualizar una transferencia
@@ -279,15 +407,14 @@ async def update_transfer(
         raise HTTPException(status_code=404, detail="Transfer not found")
     
     # Check if transfer can be updated
-    if existing_transfer["status"] in [TransferStatus.COMPLETED, TransferStatus.PROCESSING]:
+    if existing_transfer["status"] in LOCKED_TRANSFER_STATUSES:
         raise HTTPException(
             status_code=400, 
             detail="Cannot update transfer in completed or processing status"
         )
     
     # Update transfer
-    update_data = transfer_update.dict(exclude_none=True)
-    update_data["updated_at"] = datetime.utcnow()
+    update_data = transfer_update.model_dump(exclude_none=True)
     
     # Recalculate fees if amount changed
     if "amount" in update_data:
@@ -300,7 +427,9 @@ async def update_transfer(
         update_data["fees"] = fees
         update_data["total_amount"] = update_data["amount"] + fees
     
-    updated_transfer = await update_transfer_in_db(db, transfer_id, update_data)
+    updated_transfer = await update_transfer_in_db(db, transfer_id, current_user["id"], update_data)
+    if not updated_transfer:
+        raise HTTPException(status_code=404, detail="Transfer not found")
     
     return TransferResponse(**updated_transfer)
 
@@ -309,7 +438,7 @@ async def update_transfer(
 async def cancel_transfer(
     transfer_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     ❌ Cancelar una transferencia
@@ -322,7 +451,7 @@ async def cancel_transfer(
     if not transfer:
         raise HTTPException(status_code=404, detail="Transfer not found")
     
-    if transfer["status"] not in [TransferStatus.PENDING, TransferStatus.SCHEDULED]:
+    if transfer["status"] not in CANCELLABLE_TRANSFER_STATUSES:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot cancel transfer with status {transfer['status']}"
@@ -342,7 +471,7 @@ async def cancel_transfer(
 async def execute_transfer_manually(
     transfer_id: str,
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     ⚡ Ejecutar transferencia manualmente
@@ -354,7 +483,7 @@ async def execute_transfer_manually(
     if not transfer:
         raise HTTPException(status_code=404, detail="Transfer not found")
     
-    if transfer["status"] not in [TransferStatus.PENDING, TransferStatus.SCHEDULED]:
+    if transfer["status"] not in CANCELLABLE_TRANSFER_STATUSES:
         raise HTTPException(
             status_code=400,
             detail=f"Cannot execute transfer with status {transfer['status']}"
@@ -371,10 +500,10 @@ async def execute_transfer_manually(
     }
 
 
-@router.get("/recurring/active")
+@router.get("/recurring/active", response_class=ORJSONResponse)
 async def get_recurring_transfers(
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     🔄 Obtener transferencias recurrentes activas
@@ -383,18 +512,20 @@ async def get_recurring_transfers(
     """
     recurring_transfers = await get_recurring_transfers_from_db(db, current_user["id"])
     
-    return {
+    return ORJSONResponse({
         "status": "success",
-        "recurring_transfers": [TransferResponse(**t) for t in recurring_transfers],
+        "recurring_transfers": [
+            TransferResponse.model_validate(t).model_dump(mode="json") for t in recurring_transfers
+        ],
         "total": len(recurring_transfers)
-    }
+    })
 
 
 @router.post("/bulk")
 async def create_bulk_transfers(
     transfers: List[TransferCreate],
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     📦 Crear múltiples transferencias en lote
@@ -407,38 +538,32 @@ async def create_bulk_transfers(
             detail="Maximum 50 transfers per batch"
         )
     
+    transfer_rows = []
     created_transfers = []
     errors = []
     
-    for i, transfer in enumerate(transfers):
+    # Validate source account ownership for the whole batch in one query
+    owned_accounts = await batch_verify_account_ownership(
+        db, [transfer.from_account_id for transfer in transfers], current_user["id"]
+    )
+    
+    # Items are independent, so overlap their I/O instead of awaiting serially
+    semaphore = asyncio.Semaphore(BULK_TRANSFER_CONCURRENCY)
+    results = await asyncio.gather(
+        *[
+            build_bulk_transfer_data(transfer, current_user["id"], owned_accounts, semaphore)
+            for transfer in transfers
+        ],
+        return_exceptions=True
+    )
+    
+    for i, (transfer, result) in enumerate(zip(transfers, results)):
         try:
-            # Validate source account ownership
-            await verify_account_ownership(db, transfer.from_account_id, current_user["id"])
-            
-            # Calculate costs
-            fees, exchange_rate = await calculate_transfer_costs(
-                transfer.transfer_type,
-                transfer.amount,
-                transfer.currency,
-                transfer.to_account_number
-            )
-            
-            # Create transfer
-            transfer_data = {
-                **transfer.dict(),
-                "id": f"txf_{generate_id()}",
-                "user_id": current_user["id"],
-                "status": TransferStatus.PENDING,
-                "fees": fees,
-                "exchange_rate": exchange_rate,
-                "total_amount": transfer.amount + fees,
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
-            }
-            
-            saved_transfer = await save_transfer(db, transfer_data)
-            created_transfers.append(TransferResponse(**saved_transfer))
-            
+            if isinstance(result, BaseException):
+                raise result
+            # Validate before persisting so a bad item never reaches the insert
+            created_transfers.append(TransferResponse.model_validate(result))
+            transfer_rows.append(result)
         except Exception as e:
             errors.append({
                 "index": i,
@@ -446,6 +571,9 @@ async def create_bulk_transfers(
                 "transfer_description": transfer.description
             })
     
+    # Persist every valid transfer in a single round trip
+    await save_transfers_bulk(db, transfer_rows)
+    
     return {
         "status": "success" if not errors else "partial",
         "created": len(created_transfers),
@@ -459,7 +587,7 @@ async def create_bulk_transfers(
 async def get_upcoming_transfers(
     days_ahead: int = Query(30, ge=1, le=365, description="Días hacia adelante"),
     current_user: dict = Depends(get_current_user),
-    db = Depends(get_db)
+    db = Depends(get_pg)
 ):
     """
     📅 Transferencias programadas próximas
@@ -482,55 +610,98 @@ async def get_upcoming_transfers(
 
 
 # Helper functions (these would be implemented in services)
-async def verify_account_ownership(db, account_id: str, user_id: str):
+async def verify_account_ownership(account_loader: DataLoader, account_id: str, user_id: str) -> dict:
     """Verify user owns the account"""
-    # Mock implementation
-    return {"id": account_id, "user_id": user_id}
+    account = await account_loader.load(account_id)
+    if not account or account["user_id"] != user_id:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return account
+
+
+async def build_bulk_transfer_data(transfer: TransferCreate, user_id: str, owned_accounts: set, semaphore: asyncio.Semaphore) -> dict:
+    """Validate and price a single bulk transfer"""
+    async with semaphore:
+        if transfer.from_account_id not in owned_accounts:
+            raise HTTPException(status_code=404, detail="Account not found")
+        
+        # Calculate costs
+        fees, exchange_rate = await calculate_transfer_costs(
+            transfer.transfer_type,
+            transfer.amount,
+            transfer.currency,
+            transfer.to_account_number
+        )
+        
+        # Create transfer
+        now = datetime.utcnow()
+        transfer_data = {**NEW_TRANSFER_DEFAULTS, **transfer.model_dump()}
+        transfer_data.update(
+            id=f"txf_{generate_id()}",
+            user_id=user_id,
+            status=TransferStatus.PENDING,
+            fees=fees,
+            exchange_rate=exchange_rate,
+            total_amount=transfer.amount + fees,
+            created_at=now,
+            updated_at=now
+        )
+        
+        return transfer_data
 
 
 async def calculate_transfer_costs(transfer_type: TransferType, amount: float, currency: str, to_account: str = None):
     """Calculate transfer fees and exchange rates"""
-    fee_rates = {
-        TransferType.INTERNAL: 0.0,  # Free internal transfers
-        TransferType.EXTERNAL: 0.015,  # 1.5%
-        TransferType.BANK: 0.005,  # 0.5%
-        TransferType.WALLET: 0.025,  # 2.5%
-        TransferType.INTERNATIONAL: 0.035  # 3.5%
-    }
-    
-    base_fee = amount * fee_rates.get(transfer_type, 0.0)
-    
-    # Add flat fees for certain types
-    if transfer_type == TransferType.INTERNATIONAL:
-        base_fee += 5.0  # $5 flat fee
-    elif transfer_type == TransferType.BANK:
-        base_fee += 2.0  # $2 flat fee
+    base_fee = amount * TRANSFER_FEE_RATES.get(transfer_type, 0.0) + TRANSFER_FLAT_FEES.get(transfer_type, 0.0)
     
-    # Mock exchange rate (1.0 for same currency)
+    # Cross-border transfers settle in USD
     exchange_rate = 1.0
     if transfer_type == TransferType.INTERNATIONAL:
-        exchange_rate = 0.85  # Mock rate
+        exchange_rate = await get_exchange_rate(currency, "USD")
     
     return base_fee, exchange_rate
 
 
+async def get_exchange_rate(from_currency: str, to_currency: str) -> float:
+    """Get exchange rate, cached in Redis for FX_RATE_TTL seconds"""
+    async def fetch_rate() -> float:
+        rates = await ExchangeRateService().get_current_rates(from_currency, [to_currency])
+        return rates[to_currency]
+    
+    return await RedisCacheService(prefix="fx").get_or_fetch(
+        f"{from_currency}:{to_currency}", fetch_rate, ttl=FX_RATE_TTL
+    )
+
+
+def transfer_record(transfer_data: dict) -> tuple:
+    """INSERT_TRANSFER_SQL arguments for a transfer"""
+    return tuple(
+        value.value if isinstance(value, Enum) else value
+        for value in (transfer_data.get(column) for column in TRANSFER_INSERT_COLUMNS)
+    )
+
+
 async def save_transfer(db, transfer_data: dict) -> dict:
     """Save transfer to database"""
-    # Mock implementation
+    await db.execute(INSERT_TRANSFER_SQL, *transfer_record(transfer_data))
     return transfer_data
 
 
+async def save_transfers_bulk(db, transfers_data: List[dict]) -> List[dict]:
+    """Save transfers to database in a single batch"""
+    if transfers_data:
+        await db.executemany(INSERT_TRANSFER_SQL, [transfer_record(t) for t in transfers_data])
+    return transfers_data
+
+
 async def process_transfer(db, transfer_id: str) -> dict:
     """Process transfer"""
     # Mock implementation
-    await update_transfer_status(db, transfer_id, TransferStatus.COMPLETED)
     return {"transaction_id": f"txn_{generate_id()}"}
 
 
 async def update_transfer_status(db, transfer_id: str, status: TransferStatus):
     """Update transfer status"""
-    # Mock implementation
-    pass
+    await db.execute(UPDATE_TRANSFER_STATUS_SQL, transfer_id, status.value)
 
 
 async def setup_recurring_transfer(db, transfer_id: str, frequency: TransferFrequency):
@@ -546,38 +717,46 @@ async def cancel_recurring_transfer(db, transfer_id: str):
 
 
 async def get_transfers_from_db(db, filters: dict, pagination) -> List[dict]:
-    """Get transfers from database"""
-    # Mock implementation
-    return []
+    """Get transfers from database in a single query"""
+    clauses = ["t.user_id = $1"]
+    args = [filters["user_id"]]
+    
+    for key, clause in TRANSFER_FILTER_CLAUSES.items():
+        value = filters.get(key)
+        if value is not None:
+            args.append(value.value if isinstance(value, Enum) else value)
+            clauses.append(clause.format(len(args)))
+    
+    args.extend([pagination.limit, pagination.offset])
+    query = (
+        f"{LIST_TRANSFERS_SQL} WHERE {' AND '.join(clauses)} "
+        f"ORDER BY t.created_at DESC LIMIT ${len(args) - 1} OFFSET ${len(args)}"
+    )
+    
+    rows = await db.fetch(query, *args)
+    return [dict(row) for row in rows]
 
 
-async def get_transfer_by_id(db, transfer_id: str, user_id: str) -> dict:
+async def get_transfer_by_id(db, transfer_id: str, user_id: str) -> Optional[dict]:
     """Get transfer by ID"""
-    # Mock implementation
-    return {
-        "id": transfer_id,
-        "user_id": user_id,
-        "description": "Test Transfer",
-        "amount": 500.0,
-        "currency": "USD",
-        "status": TransferStatus.PENDING,
-        "transfer_type": TransferType.INTERNAL,
-        "from_account_id": "acc_123",
-        "to_account_id": "acc_456",
-        "recipient_name": "John Doe",
-        "is_recurring": False,
-        "created_at": datetime.utcnow(),
-        "updated_at": datetime.utcnow(),
-        "tags": []
-    }
+    row = await db.fetchrow(GET_TRANSFER_SQL, transfer_id, user_id)
+    return dict(row) if row else None
 
 
-async def update_transfer_in_db(db, transfer_id: str, update_data: dict) -> dict:
-    """Update transfer in database"""
-    # Mock implementation
-    transfer = await get_transfer_by_id(db, transfer_id, "user_123")
-    transfer.update(update_data)
-    return transfer
+async def update_transfer_in_db(db, transfer_id: str, user_id: str, update_data: dict) -> Optional[dict]:
+    """Update transfer in database and return it with its joined names"""
+    # Only user-editable and recalculated columns are written; updated_at is set by the query
+    columns = [column for column in update_data if column in TRANSFER_UPDATE_COLUMNS]
+    if not columns:
+        return await get_transfer_by_id(db, transfer_id, user_id)
+    
+    assignments = ", ".join(f"{column} = ${i}" for i, column in enumerate(columns, start=3))
+    values = [
+        update_data[column].value if isinstance(update_data[column], Enum) else update_data[column]
+        for column in columns
+    ]
+    row = await db.fetchrow(UPDATE_TRANSFER_SQL.format(assignments), transfer_id, user_id, *values)
+    return dict(row) if row else None
 
 
 async def get_recurring_transfers_from_db(db, user_id: str) -> List[dict]:
@@ -587,12 +766,11 @@ async def get_recurring_transfers_from_db(db, user_id: str) -> List[dict]:
 
 
 async def get_scheduled_transfers(db, user_id: str, end_date: date) -> List[dict]:
-    """Get scheduled transfers"""
-    # Mock implementation
-    return []
+    """Get scheduled transfers up to and including end_date"""
+    rows = await db.fetch(GET_SCHEDULED_TRANSFERS_SQL, user_id, end_date)
+    return [dict(row) for row in rows]
 
 
 def generate_id() -> str:
     """Generate unique ID"""
-    import uuid
-    return str(uuid.uuid4())[:8]
\ No newline at end of file
+    return token_hex(4)
\ No newline at end of file
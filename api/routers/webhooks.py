@@ -3,7 +3,7 @@
 """
 
 from fastapi import APIRouter, Request, HTTPException
-from core.security import verify_webhook_signature
+from core.security import new_webhook_hmac, verify_webhook_digest
 
 router = APIRouter()
 
@@ -11,11 +11,13 @@ router = APIRouter()
 @router.post("/bank-transaction")
 async def bank_transaction_webhook(request: Request):
     """Webhook for bank transactions"""
-    # Verify webhook signature
-    body = await request.body()
+    # Verify webhook signature, hashing the body as it streams in
     signature = request.headers.get("x-webhook-signature", "")
+    mac = new_webhook_hmac()
+    async for chunk in request.stream():
+        mac.update(chunk)
     
-    if not verify_webhook_signature(body, signature):
+    if not verify_webhook_digest(mac, signature):
         raise HTTPException(status_code=401, detail="Invalid signature")
     
     return {"status": "received"}
@@ -2,12 +2,15 @@
 Base schemas and common Pydantic models
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
 
+_VALID_CURRENCIES = frozenset({'USD', 'MXN', 'COP', 'EUR', 'GBP', 'CAD', 'JPY'})
+
+
 class ResponseStatus(str, Enum):
     SUCCESS = "success"
     ERROR = "error"
@@ -51,9 +54,10 @@ class FilterParams(BaseModel):
     end_date: Optional[datetime] = Field(None, description="Filter until this date")
     search: Optional[str] = Field(None, description="Search term")
     
-    @validator('end_date')
-    def end_date_must_be_after_start_date(cls, v, values):
-        if v and values.get('start_date') and v < values.get('start_date'):
+    @field_validator('end_date')
+    @classmethod
+    def end_date_must_be_after_start_date(cls, v, info: ValidationInfo):
+        if v and info.data.get('start_date') and v < info.data.get('start_date'):
             raise ValueError('end_date must be after start_date')
         return v
 
@@ -63,12 +67,12 @@ class CurrencyAmount(BaseModel):
     amount: float = Field(..., description="Amount value")
     currency: str = Field(..., description="Currency code (ISO 4217)")
     
-    @validator('currency')
+    @field_validator('currency')
+    @classmethod
     def currency_must_be_valid(cls, v):
-        valid_currencies = ['USD', 'MXN', 'COP', 'EUR', 'GBP', 'CAD', 'JPY']
-        if v not in valid_currencies:
-            raise ValueError(f'Currency must be one of: {valid_currencies}')
-        return v.upper()
+        if (v_up := v.upper()) not in _VALID_CURRENCIES:
+            raise ValueError(f'Currency must be one of: {sorted(_VALID_CURRENCIES)}')
+        return v_up
 
 
 class ErrorDetail(BaseModel):
@@ -6,6 +6,16 @@ from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 
+# Static fields shared by every mock insight
+INSIGHT_TEMPLATE = {
+    "impact": "medium",
+    "category": "spending",
+    "action_required": False,
+    "confidence_score": 0.8
+}
+INSIGHT_SUGGESTED_ACTIONS = ("Review monthly budget", "Consider cost reduction")
+
+
 class AIService:
     def __init__(self):
         pass
@@ -36,21 +46,18 @@ class AIInsightsService:
     
     async def generate_smart_insights(self, financial_data: Dict[str, Any], user_profile: Dict[str, Any], categories: Optional[List[str]], impact_level: Optional[str], limit: int) -> List[Dict[str, Any]]:
         """Generate smart insights using AI"""
-        insights = []
-        
-        for i in range(min(limit, 3)):  # Mock 3 insights
-            insights.append({
-                "title": f"Insight {i+1}",
-                "description": f"AI-generated insight about your finances {i+1}",
-                "impact": "medium",
-                "category": "spending",
-                "action_required": False,
-                "suggested_actions": ["Review monthly budget", "Consider cost reduction"],
-                "confidence_score": 0.8,
-                "created_at": datetime.utcnow()
-            })
+        now = datetime.utcnow()
         
-        return insights
+        return [
+            dict(
+                INSIGHT_TEMPLATE,
+                title=f"Insight {i+1}",
+                description=f"AI-generated insight about your finances {i+1}",
+                suggested_actions=list(INSIGHT_SUGGESTED_ACTIONS),
+                created_at=now
+            )
+            for i in range(min(limit, 3))  # Mock 3 insights
+        ]
     
     async def refresh_user_insights(self, user_id: str, force_refresh: bool = False) -> Dict[str, Any]:
         """Refresh user insights in background"""
@@ -4,10 +4,76 @@ Analytics Service - Advanced financial analytics and insights
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
+import asyncio
 import pandas as pd
 import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+
+
+# Constant parts of the mock analytics payloads. Nested amounts are shared
+# read-only; per-call fields and mutable lists are added by each method.
+HEALTH_SKELETON = {
+    "overall_score": 78,
+    "savings_ratio": 0.15,
+    "debt_to_income_ratio": 0.25,
+    "spending_consistency": 0.82,
+    "emergency_fund_months": 3.5
+}
+
+EXPENSE_SKELETON = {
+    "total_expenses": {
+        "amount": 2500.0,
+        "currency": "USD"
+    }
+}
+
+INCOME_SKELETON = {
+    "total_income": {
+        "amount": 3500.0,
+        "currency": "USD"
+    },
+    "growth_rate": 0.05,
+    "stability_score": 0.85
+}
+
+SAVINGS_SKELETON = {
+    "total_saved": {
+        "amount": 5000.0,
+        "currency": "USD"
+    },
+    "savings_rate": 0.15,
+    "monthly_average": {
+        "amount": 400.0,
+        "currency": "USD"
+    },
+    "optimal_savings_amount": {
+        "amount": 500.0,
+        "currency": "USD"
+    }
+}
+
+TREND_SKELETON = {
+    "trend_direction": "stable",
+    "trend_strength": 0.6
+}
+
+COMPARISON_SKELETON = {
+    "change_percentage": 5.2,
+    "change_amount": {
+        "amount": 150.0,
+        "currency": "USD"
+    }
+}
+
+FINANCIAL_SUMMARY_SKELETON = {
+    "total_balance": 10000.0,
+    "monthly_income": 3500.0,
+    "monthly_expenses": 2800.0
+}
+
+
+async def _none() -> None:
+    """Placeholder for a skipped dashboard section"""
+    return None
 
 
 class AnalyticsService:
@@ -17,18 +83,28 @@ class AnalyticsService:
     
     async def get_complete_dashboard(self, request) -> Dict[str, Any]:
         """Generate complete financial dashboard"""
+        # Sections are independent, so load them concurrently
+        health, expenses, income, budget, savings, cash_flow = await asyncio.gather(
+            self.calculate_financial_health(),
+            self.get_expense_analytics(request),
+            self.get_income_analytics(request),
+            self.get_budget_performance(),
+            self.get_savings_analytics(),
+            self.predict_cash_flow(3) if request.include_predictions else _none()
+        )
+        
         return {
             "period_info": {
                 "period": request.period,
                 "start_date": request.start_date,
                 "end_date": request.end_date
             },
-            "financial_health": await self.calculate_financial_health(),
-            "expense_analytics": await self.get_expense_analytics(request),
-            "income_analytics": await self.get_income_analytics(request),
-            "budget_performance": await self.get_budget_performance(),
-            "savings_analytics": await self.get_savings_analytics(),
-            "cash_flow_predictions": await self.predict_cash_flow(3) if request.include_predictions else None,
+            "financial_health": health,
+            "expense_analytics": expenses,
+            "income_analytics": income,
+            "budget_performance": budget,
+            "savings_analytics": savings,
+            "cash_flow_predictions": cash_flow,
             "insights": ["Sample insight 1", "Sample insight 2"],
             "alerts": []
         }
@@ -36,25 +112,16 @@ class AnalyticsService:
     async def calculate_financial_health(self) -> Dict[str, Any]:
         """Calculate comprehensive financial health score"""
         # Mock implementation - replace with real calculations
-        return {
-            "overall_score": 78,
-            "savings_ratio": 0.15,
-            "debt_to_income_ratio": 0.25,
-            "spending_consistency": 0.82,
-            "emergency_fund_months": 3.5,
-            "recommendations": []
-        }
+        return {**HEALTH_SKELETON, "recommendations": []}
     
     async def get_expense_analytics(self, request) -> Dict[str, Any]:
         """Get detailed expense analytics"""
+        today = datetime.now().date()
         return {
+            **EXPENSE_SKELETON,
             "period": request.period,
-            "start_date": request.start_date or datetime.now().date(),
-            "end_date": request.end_date or datetime.now().date(),
-            "total_expenses": {
-                "amount": 2500.0,
-                "currency": "USD"
-            },
+            "start_date": request.start_date or today,
+            "end_date": request.end_date or today,
             "categories": [],
             "top_merchants": [],
             "unusual_spending": []
@@ -62,17 +129,13 @@ class AnalyticsService:
     
     async def get_income_analytics(self, request) -> Dict[str, Any]:
         """Get detailed income analytics"""
+        today = datetime.now().date()
         return {
+            **INCOME_SKELETON,
             "period": request.period,
-            "start_date": request.start_date or datetime.now().date(),
-            "end_date": request.end_date or datetime.now().date(),
-            "total_income": {
-                "amount": 3500.0,
-                "currency": "USD"
-            },
-            "sources": [],
-            "growth_rate": 0.05,
-            "stability_score": 0.85
+            "start_date": request.start_date or today,
+            "end_date": request.end_date or today,
+            "sources": []
         }
     
     async def get_budget_performance(self) -> List[Dict[str, Any]]:
@@ -81,22 +144,7 @@ class AnalyticsService:
     
     async def get_savings_analytics(self) -> Dict[str, Any]:
         """Get savings analytics"""
-        return {
-            "total_saved": {
-                "amount": 5000.0,
-                "currency": "USD"
-            },
-            "savings_rate": 0.15,
-            "monthly_average": {
-                "amount": 400.0,
-                "currency": "USD"
-            },
-            "savings_goals_progress": [],
-            "optimal_savings_amount": {
-                "amount": 500.0,
-                "currency": "USD"
-            }
-        }
+        return {**SAVINGS_SKELETON, "savings_goals_progress": []}
     
     async def analyze_spending_patterns(self, period: str, categories: Optional[List[str]], include_predictions: bool) -> Dict[str, Any]:
         """Analyze spending patterns with ML"""
@@ -109,61 +157,57 @@ class AnalyticsService:
     
     async def predict_cash_flow(self, months_ahead: int, include_scenarios: bool = False) -> List[Dict[str, Any]]:
         """Predict future cash flow"""
-        predictions = []
-        for i in range(months_ahead):
-            future_date = datetime.now().date() + timedelta(days=30 * (i + 1))
-            predictions.append({
-                "date": future_date.isoformat(),
+        # Work on whole monthly arrays so model output can drop in here later
+        today = np.datetime64(datetime.now().date())
+        dates = today + np.arange(1, months_ahead + 1) * np.timedelta64(30, "D")
+        income = np.full(months_ahead, 3500.0)
+        expenses = np.full(months_ahead, 2800.0)
+        balance = income - expenses
+        
+        return [
+            {
+                "date": str(date),
                 "predicted_income": {
-                    "amount": 3500.0,
+                    "amount": predicted_income,
                     "currency": "USD"
                 },
                 "predicted_expenses": {
-                    "amount": 2800.0,
+                    "amount": predicted_expenses,
                     "currency": "USD"
                 },
                 "predicted_balance": {
-                    "amount": 700.0,
+                    "amount": predicted_balance,
                     "currency": "USD"
                 },
                 "confidence_score": 0.85
-            })
-        return predictions
+            }
+            for date, predicted_income, predicted_expenses, predicted_balance
+            in zip(dates, income.tolist(), expenses.tolist(), balance.tolist())
+        ]
     
     async def analyze_trend(self, metric: str, period: str, lookback_months: int) -> Dict[str, Any]:
         """Analyze trends for financial metrics"""
         return {
+            **TREND_SKELETON,
             "metric_name": metric,
             "period": period,
             "data_points": [],
-            "trend_direction": "stable",
-            "trend_strength": 0.6,
             "seasonal_patterns": []
         }
     
     async def compare_periods(self, comparison_type: str, current_period_start: Optional[datetime], current_period_end: Optional[datetime]) -> Dict[str, Any]:
         """Compare different periods"""
         return {
+            **COMPARISON_SKELETON,
             "comparison_type": comparison_type,
             "current_period": {},
             "previous_period": {},
-            "change_percentage": 5.2,
-            "change_amount": {
-                "amount": 150.0,
-                "currency": "USD"
-            },
             "significant_changes": []
         }
     
     async def get_user_financial_summary(self) -> Dict[str, Any]:
         """Get user's financial data summary for AI processing"""
-        return {
-            "total_balance": 10000.0,
-            "monthly_income": 3500.0,
-            "monthly_expenses": 2800.0,
-            "categories": [],
-            "recent_transactions": []
-        }
+        return {**FINANCIAL_SUMMARY_SKELETON, "categories": [], "recent_transactions": []}
     
     async def export_analytics(self, format: str, include_insights: bool, include_predictions: bool) -> Dict[str, Any]:
         """Export analytics in various formats"""
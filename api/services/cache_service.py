@@ -0,0 +1,41 @@
+"""
+Cache Service - Redis-backed JSON cache for slow lookups
+"""
+
+from typing import Any, Awaitable, Callable, Optional
+import json
+from redis.exceptions import RedisError
+from core.redis import get_redis
+
+
+class RedisCacheService:
+    def __init__(self, prefix: str = "cache"):
+        self.redis = get_redis()
+        self.prefix = prefix
+    
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Get cached value (None on miss or if Redis is unavailable)"""
+        try:
+            cached = await self.redis.get(self._key(key))
+        except RedisError as e:
+            print(f"Cache read failed: {e}")
+            return None
+        return json.loads(cached) if cached is not None else None
+    
+    async def set(self, key: str, value: Any, ttl: int):
+        """Cache value for ttl seconds"""
+        try:
+            await self.redis.setex(self._key(key), ttl, json.dumps(value))
+        except RedisError as e:
+            print(f"Cache write failed: {e}")
+    
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl: int) -> Any:
+        """Return cached value, fetching and caching it on a miss"""
+        value = await self.get(key)
+        if value is None:
+            value = await fetch()
+            await self.set(key, value, ttl)
+        return value
@@ -2,9 +2,44 @@
 Exchange Rate Service - Currency conversion rates
 """
 
-from typing import Dict, List, Any
+from typing import Awaitable, Callable, Dict, List, Any, Mapping
 from datetime import datetime
+from types import MappingProxyType
 import httpx
+import time
+
+
+# Mock USD-based rate table, read-only so concurrent requests can share it
+_MOCK_RATES: Mapping[str, float] = MappingProxyType({
+    "USD": 1.0,
+    "MXN": 17.5,
+    "EUR": 0.85,
+    "COP": 4200.0,
+    "GBP": 0.75,
+    "CAD": 1.35,
+    "JPY": 150.0
+})
+
+# Seconds a rate table is reused before it is fetched again
+RATES_CACHE_TTL = 300
+RATES_CACHE_MAX_SIZE = 512
+
+# (kind, base, targets[, date]) -> (expires_at, rates); shared by all instances
+_rates_cache: Dict[tuple, tuple] = {}
+
+
+async def _cached_rates(key: tuple, fetch: Callable[[], Awaitable[Dict[str, float]]]) -> Dict[str, float]:
+    """Return rates for key from the TTL cache, fetching on a miss"""
+    now = time.monotonic()
+    entry = _rates_cache.get(key)
+    if entry and entry[0] > now:
+        return dict(entry[1])
+    
+    rates = await fetch()
+    if len(_rates_cache) >= RATES_CACHE_MAX_SIZE:
+        _rates_cache.pop(next(iter(_rates_cache)))
+    _rates_cache[key] = (now + RATES_CACHE_TTL, rates)
+    return dict(rates)
 
 
 class ExchangeRateService:
@@ -13,31 +48,29 @@ class ExchangeRateService:
     
     async def get_current_rates(self, base_currency: str, target_currencies: List[str]) -> Dict[str, float]:
         """Get current exchange rates"""
+        targets = tuple(sorted(target_currencies))
+        return await _cached_rates(
+            ("current", base_currency, targets),
+            lambda: self._fetch_current_rates(base_currency, targets)
+        )
+    
+    async def _fetch_current_rates(self, base_currency: str, target_currencies: tuple) -> Dict[str, float]:
+        """Fetch current exchange rates from the provider"""
         # Mock implementation - replace with real API call
-        rates = {
-            "USD": 1.0,
-            "MXN": 17.5,
-            "EUR": 0.85,
-            "COP": 4200.0,
-            "GBP": 0.75,
-            "CAD": 1.35,
-            "JPY": 150.0
-        }
+        rates = _MOCK_RATES
         
         # Calculate rates relative to base currency
-        base_rate = rates.get(base_currency, 1.0)
-        result = {}
-        
-        for target in target_currencies:
-            target_rate = rates.get(target, 1.0)
-            result[target] = target_rate / base_rate
-        
-        return result
+        inv_base = 1.0 / rates.get(base_currency, 1.0)
+        return {target: rates.get(target, 1.0) * inv_base for target in target_currencies}
     
     async def get_historical_rates(self, base_currency: str, target_currencies: List[str], date: str) -> Dict[str, float]:
         """Get historical exchange rates for specific date"""
         # Mock implementation - in real implementation, call historical API
-        return await self.get_current_rates(base_currency, target_currencies)
+        targets = tuple(sorted(target_currencies))
+        return await _cached_rates(
+            ("historical", base_currency, targets, date),
+            lambda: self._fetch_current_rates(base_currency, targets)
+        )
     
     def get_provider_info(self) -> Dict[str, Any]:
         """Get exchange rate provider information"""
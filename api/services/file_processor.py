@@ -3,37 +3,114 @@ File Processor Service - Handle CSV/Excel imports
 """
 
 import pandas as pd
-from typing import Dict, List, Any, Optional
+import numpy as np
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
+from functools import lru_cache
 import io
+import re
+from xml.etree import ElementTree
+from zipfile import BadZipFile, ZipFile
+
+
+# Rows read per CSV chunk, bounding memory on large imports
+CSV_CHUNK_SIZE = 50_000
+
+# Predefined bank export layouts offered by the import template picker
+IMPORT_TEMPLATES = (
+    {
+        "name": "Banco de México",
+        "description": "Formato estándar de exportación",
+        "mapping": {
+            "date_column": "Fecha",
+            "description_column": "Descripción",
+            "amount_column": "Monto",
+            "currency_column": "Moneda"
+        }
+    },
+    {
+        "name": "BBVA",
+        "description": "Exportación de BBVA México",
+        "mapping": {
+            "date_column": "Date",
+            "description_column": "Description",
+            "amount_column": "Amount",
+            "currency_column": "Currency"
+        }
+    }
+)
+
+# Namespace of xl/workbook.xml in .xlsx packages
+XLSX_MAIN_NS = {"a": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+
+# Header keyword -> mapping field (the leftmost keyword in a header wins)
+COLUMN_KEYWORDS = {
+    "date": "date_column",
+    "fecha": "date_column",
+    "description": "description_column",
+    "desc": "description_column",
+    "descripcion": "description_column",
+    "amount": "amount_column",
+    "monto": "amount_column",
+    "valor": "amount_column"
+}
+
+# All keywords compiled into one pattern so each header is scanned once
+COLUMN_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, COLUMN_KEYWORDS)))
+
+
+def _text_column(df: pd.DataFrame, column: Optional[str], default: str) -> List[str]:
+    """Column values as strings, or the default when the column is missing"""
+    if column in df.columns:
+        return df[column].astype(str).tolist()
+    return [default] * len(df)
+
+
+@lru_cache(maxsize=32)
+def _compile_processor(mapping_items: frozenset) -> Callable[[pd.DataFrame], List[Dict[str, Any]]]:
+    """Build a frame-to-transactions converter with one mapping's columns baked in"""
+    mapping = dict(mapping_items)
+    date_column = mapping["date_column"]
+    description_column = mapping["description_column"]
+    amount_column = mapping["amount_column"]
+    currency_column = mapping.get("currency_column")
+    
+    def process(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        # Convert whole columns at once instead of walking rows
+        dates = _text_column(df, date_column, "")
+        descriptions = _text_column(df, description_column, "")
+        currencies = _text_column(df, currency_column, "USD")
+        
+        if amount_column in df.columns:
+            amounts = pd.to_numeric(df[amount_column], errors="coerce").fillna(0.0).to_numpy(dtype=np.float64)
+        else:
+            amounts = np.zeros(len(df))
+        
+        return [
+            {"date": date, "description": description, "amount": amount, "currency": currency}
+            for date, description, amount, currency in zip(dates, descriptions, amounts.tolist(), currencies)
+        ]
+    
+    return process
 
 
 class FileProcessor:
     def __init__(self):
         pass
     
-    async def auto_detect_columns(self, df: pd.DataFrame) -> 'ImportMapping':
+    async def auto_detect_columns(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Auto-detect column mapping from DataFrame"""
-        from schemas.analytics import ImportMapping  # Local import to avoid circular dependency
-        
-        # Simple heuristic column detection
-        columns = df.columns.str.lower()
-        
-        date_column = None
-        description_column = None
-        amount_column = None
+        # Simple heuristic column detection, keeping the original column names
+        detected = {}
         
-        for col in columns:
-            if any(word in col for word in ['date', 'fecha']):
-                date_column = col
-            elif any(word in col for word in ['description', 'desc', 'descripcion']):
-                description_column = col
-            elif any(word in col for word in ['amount', 'monto', 'valor']):
-                amount_column = col
+        for col in df.columns:
+            match = COLUMN_KEYWORD_PATTERN.search(str(col).lower())
+            if match:
+                detected.setdefault(COLUMN_KEYWORDS[match.group()], col)
         
         return {
-            "date_column": date_column or df.columns[0],
-            "description_column": description_column or df.columns[1] if len(df.columns) > 1 else df.columns[0],
-            "amount_column": amount_column or df.columns[-1],
+            "date_column": detected.get("date_column", df.columns[0]),
+            "description_column": detected.get("description_column", df.columns[1] if len(df.columns) > 1 else df.columns[0]),
+            "amount_column": detected.get("amount_column", df.columns[-1]),
             "currency_column": None,
             "category_column": None,
             "account_column": None
@@ -41,18 +118,12 @@ class FileProcessor:
     
     async def process_csv_data(self, df: pd.DataFrame, mapping: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process CSV data into transactions"""
-        processed_data = []
-        
-        for _, row in df.iterrows():
-            transaction = {
-                "date": str(row.get(mapping["date_column"], "")),
-                "description": str(row.get(mapping["description_column"], "")),
-                "amount": float(row.get(mapping["amount_column"], 0)),
-                "currency": str(row.get(mapping.get("currency_column"), "USD")),
-            }
-            processed_data.append(transaction)
-        
-        return processed_data
+        return _compile_processor(frozenset(mapping.items()))(df)
+    
+    async def iter_csv(self, source, mapping: Dict[str, Any], chunksize: int = CSV_CHUNK_SIZE) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield processed transactions from a CSV one chunk at a time"""
+        for chunk in pd.read_csv(source, chunksize=chunksize):
+            yield await self.process_csv_data(chunk, mapping)
     
     async def process_excel_data(self, df: pd.DataFrame, mapping: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process Excel data into transactions"""
@@ -60,33 +131,21 @@ class FileProcessor:
     
     def get_sheet_names(self, excel_data: io.BytesIO) -> List[str]:
         """Get sheet names from Excel file"""
+        # .xlsx is a zip package: read the sheet list from workbook.xml alone
+        try:
+            with ZipFile(excel_data) as workbook:
+                root = ElementTree.fromstring(workbook.read("xl/workbook.xml"))
+            return [sheet.attrib["name"] for sheet in root.findall("a:sheets/a:sheet", XLSX_MAIN_NS)]
+        except (BadZipFile, KeyError, ElementTree.ParseError):
+            excel_data.seek(0)
+        
+        # Legacy .xls or unusual layouts
         try:
             excel_file = pd.ExcelFile(excel_data)
             return excel_file.sheet_names
         except:
             return ["Sheet1"]
     
-    async def get_import_templates(self) -> List[Dict[str, Any]]:
-        """Get predefined import templates"""
-        return [
-            {
-                "name": "Banco de México",
-                "description": "Formato estándar de exportación",
-                "mapping": {
-                    "date_column": "Fecha",
-                    "description_column": "Descripción",
-                    "amount_column": "Monto",
-                    "currency_column": "Moneda"
-                }
-            },
-            {
-                "name": "BBVA",
-                "description": "Exportación de BBVA México",
-                "mapping": {
-                    "date_column": "Date",
-                    "description_column": "Description",
-                    "amount_column": "Amount",
-                    "currency_column": "Currency"
-                }
-            }
-        ]
\ No newline at end of file
+    def get_import_templates(self) -> Tuple[Dict[str, Any], ...]:
+        """Get predefined import templates (shared, do not mutate)"""
+        return IMPORT_TEMPLATES
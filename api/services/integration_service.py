@@ -2,7 +2,23 @@
 Integration Service - External integrations and data import
 """
 
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterable, Dict, List, Any, Optional
+from itertools import islice
+import hashlib
+
+
+# Rows sent per bulk insert request
+IMPORT_BATCH_SIZE = 1000
+
+# Key used to skip rows that were already imported; on_conflict needs the
+# matching unique index on transactions.import_hash from supabase/migrations
+TRANSACTION_DEDUP_COLUMNS = "user_id,import_hash"
+
+
+def import_hash(account_id: str, transaction: Dict[str, Any]) -> str:
+    """Stable fingerprint of an imported row, used to skip re-imports"""
+    key = f"{account_id}|{transaction['date']}|{transaction['amount']}|{transaction['description']}"
+    return hashlib.sha256(key.encode()).hexdigest()
 
 
 class IntegrationService:
@@ -28,11 +44,48 @@ class IntegrationService:
     
     async def import_transactions(self, processed_data: List[Dict[str, Any]], account_id: str) -> Dict[str, Any]:
         """Import transactions to database"""
-        return {
-            "imported": len(processed_data),
-            "duplicates": 0,
-            "errors": 0
-        }
+        # Files carry signed amounts; the table stores the magnitude plus a type
+        rows = (
+            {
+                "user_id": self.user_id,
+                "account_id": account_id,
+                "transaction_date": transaction["date"],
+                "description": transaction["description"],
+                "amount": abs(transaction["amount"]),
+                "type": "expense" if transaction["amount"] < 0 else "income",
+                "import_hash": import_hash(account_id, transaction)
+            }
+            for transaction in processed_data
+        )
+        result = {"imported": 0, "duplicates": 0, "errors": 0}
+        
+        # One request per batch instead of one per row; duplicates are skipped
+        while batch := list(islice(rows, IMPORT_BATCH_SIZE)):
+            try:
+                response = self.db.table("transactions").upsert(
+                    batch,
+                    on_conflict=TRANSACTION_DEDUP_COLUMNS,
+                    ignore_duplicates=True
+                ).execute()
+                inserted = len(response.data or [])
+                result["imported"] += inserted
+                result["duplicates"] += len(batch) - inserted
+            except Exception as e:
+                print(f"Transaction import batch failed: {e}")
+                result["errors"] += len(batch)
+        
+        return result
+    
+    async def import_transaction_batches(self, batches: AsyncIterable[List[Dict[str, Any]]], account_id: str) -> Dict[str, Any]:
+        """Import transactions batch by batch as they are produced"""
+        totals = {"imported": 0, "duplicates": 0, "errors": 0}
+        
+        async for batch in batches:
+            result = await self.import_transactions(batch, account_id)
+            for key in totals:
+                totals[key] += result[key]
+        
+        return totals
     
     async def get_connection(self, connection_id: str) -> Optional[Dict[str, Any]]:
         """Get specific connection"""
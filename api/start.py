@@ -8,6 +8,7 @@ Script para iniciar la API con todas las configuraciones y validaciones necesari
 import sys
 import os
 import asyncio
+import importlib.util
 from pathlib import Path
 
 # Add current directory to path
@@ -15,26 +16,27 @@ sys.path.append(str(Path(__file__).parent))
 
 def check_requirements():
     """Verificar que todas las dependencias estén instaladas"""
-    required_packages = [
-        'fastapi',
-        'uvicorn',
-        'pydantic',
-        'supabase',
-        'redis',
-        'pandas',
-        'numpy',
-        'scikit-learn'
-    ]
+    # Package name -> top-level module it installs
+    required_packages = {
+        'fastapi': 'fastapi',
+        'uvicorn': 'uvicorn',
+        'pydantic': 'pydantic',
+        'supabase': 'supabase',
+        'redis': 'redis',
+        'pandas': 'pandas',
+        'numpy': 'numpy',
+        'scikit-learn': 'sklearn'
+    }
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-            print(f"✅ {package}")
-        except ImportError:
+    # find_spec only locates the module, without running its import
+    for package, module in required_packages.items():
+        if importlib.util.find_spec(module) is None:
             missing_packages.append(package)
             print(f"❌ {package} - NOT FOUND")
+        else:
+            print(f"✅ {package}")
     
     if missing_packages:
         print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
@@ -83,30 +85,44 @@ def create_directories():
         print(f"✅ Directory created: {dir_name}")
 
 
-async def test_connections():
-    """Probar conexiones a servicios externos"""
-    print("\n🔗 Testing external connections...")
-    
+async def _redis_probe():
+    """Probar conexión a Redis"""
     try:
-        # Test Redis connection
-        import redis
-        from core.config import settings
+        from core.redis import get_redis, pool
         
-        redis_client = redis.Redis.from_url(settings.REDIS_URL)
-        redis_client.ping()
+        try:
+            await get_redis().ping()
+        finally:
+            # The probe runs on its own event loop; let the server open fresh connections
+            await pool.disconnect()
         print("✅ Redis connection successful")
     except Exception as e:
         print(f"⚠️  Redis connection failed: {e}")
-    
+
+
+async def _supabase_probe():
+    """Probar conexión a Supabase"""
     try:
-        # Test Supabase connection
-        from core.database import init_db
-        await init_db()
+        from core.database import init_db, close_db
+        
+        try:
+            await init_db()
+        finally:
+            # Same as Redis: don't leave a pool bound to the probe's event loop
+            await close_db()
         print("✅ Supabase connection successful")
     except Exception as e:
         print(f"⚠️  Supabase connection failed: {e}")
 
 
+async def test_connections():
+    """Probar conexiones a servicios externos"""
+    print("\n🔗 Testing external connections...")
+    
+    # Independent probes, so run them side by side
+    await asyncio.gather(_redis_probe(), _supabase_probe(), return_exceptions=True)
+
+
 def main():
     """Función principal para iniciar la API"""
     print("🏦 Finance Garden API - Starting up...")
@@ -5,7 +5,7 @@
 
 import asyncio
 import httpx
-import json
+import orjson
 from datetime import datetime, timedelta
 
 async def test_crud_endpoints():
@@ -15,10 +15,29 @@ async def test_crud_endpoints():
     print("🧪 Testing Finance Garden API CRUD Endpoints")
     print("=" * 50)
     
-    async with httpx.AsyncClient() as client:
+    # Read-only checks that don't depend on each other
+    get_paths = {
+        "health": "/health",
+        "openapi": "/openapi.json",
+        "dashboard": "/api/v1/analytics/dashboard",
+        "patterns": "/api/v1/analytics/spending-patterns",
+        "cash_flow": "/api/v1/analytics/cash-flow/predictions",
+        "insights": "/api/v1/analytics/insights",
+        "suggestions": "/api/v1/automation/suggestions",
+        "rates": "/api/v1/integrations/exchange-rates"
+    }
+    limits = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+    
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        # Fire every GET at once; results are reported in order below
+        responses = dict(zip(
+            get_paths,
+            await asyncio.gather(*[client.get(path) for path in get_paths.values()])
+        ))
+        
         # 1. Test Health Check
         print("1. Testing Health Check...")
-        response = await client.get(f"{base_url}/health")
+        response = responses["health"]
         if response.status_code == 200:
             print("✅ Health check passed")
         else:
@@ -26,9 +45,9 @@ async def test_crud_endpoints():
         
         # 2. Test OpenAPI documentation
         print("\n2. Testing OpenAPI Documentation...")
-        response = await client.get(f"{base_url}/openapi.json")
+        response = responses["openapi"]
         if response.status_code == 200:
-            openapi_data = response.json()
+            openapi_data = orjson.loads(response.content)
             paths = list(openapi_data.get("paths", {}).keys())
             print(f"✅ OpenAPI schema loaded with {len(paths)} endpoints")
             
@@ -50,34 +69,34 @@ async def test_crud_endpoints():
         print("\n3. Testing Analytics Endpoints...")
         
         # Dashboard
-        response = await client.get(f"{base_url}/api/v1/analytics/dashboard")
+        response = responses["dashboard"]
         if response.status_code == 200:
-            dashboard = response.json()
+            dashboard = orjson.loads(response.content)
             print("✅ Dashboard endpoint working")
             print(f"   Health Score: {dashboard.get('financial_health', {}).get('overall_score')}")
         else:
             print("❌ Dashboard endpoint failed")
         
         # Spending Patterns
-        response = await client.get(f"{base_url}/api/v1/analytics/spending-patterns")
+        response = responses["patterns"]
         if response.status_code == 200:
-            patterns = response.json()
+            patterns = orjson.loads(response.content)
             print("✅ Spending patterns endpoint working")
         else:
             print("❌ Spending patterns endpoint failed")
         
         # Cash Flow Predictions
-        response = await client.get(f"{base_url}/api/v1/analytics/cash-flow/predictions")
+        response = responses["cash_flow"]
         if response.status_code == 200:
-            predictions = response.json()
+            predictions = orjson.loads(response.content)
             print(f"✅ Cash flow predictions working - {len(predictions)} predictions returned")
         else:
             print("❌ Cash flow predictions failed")
         
         # AI Insights
-        response = await client.get(f"{base_url}/api/v1/analytics/insights")
+        response = responses["insights"]
         if response.status_code == 200:
-            insights = response.json()
+            insights = orjson.loads(response.content)
             print(f"✅ AI insights working - {len(insights)} insights returned")
         else:
             print("❌ AI insights failed")
@@ -86,9 +105,9 @@ async def test_crud_endpoints():
         print("\n4. Testing Automation Endpoints...")
         
         # Automation Suggestions
-        response = await client.get(f"{base_url}/api/v1/automation/suggestions")
+        response = responses["suggestions"]
         if response.status_code == 200:
-            suggestions = response.json()
+            suggestions = orjson.loads(response.content)
             print(f"✅ Automation suggestions working - {suggestions.get('total', 0)} suggestions")
         else:
             print("❌ Automation suggestions failed")
@@ -99,9 +118,9 @@ async def test_crud_endpoints():
             "rule_type": "categorization",
             "is_active": True
         }
-        response = await client.post(f"{base_url}/api/v1/automation/rules", json=rule_data)
+        response = await client.post("/api/v1/automation/rules", json=rule_data)
         if response.status_code == 200:
-            rule = response.json()
+            rule = orjson.loads(response.content)
             print("✅ Automation rule creation working")
             print(f"   Rule: {rule.get('rule', {}).get('name')}")
         else:
@@ -111,9 +130,9 @@ async def test_crud_endpoints():
         print("\n5. Testing Integration Endpoints...")
         
         # Exchange Rates
-        response = await client.get(f"{base_url}/api/v1/integrations/exchange-rates")
+        response = responses["rates"]
         if response.status_code == 200:
-            rates = response.json()
+            rates = orjson.loads(response.content)
             print("✅ Exchange rates working")
             print(f"   Base: {rates.get('base_currency')}")
             for currency, rate in list(rates.get('rates', {}).items())[:3]:
@@ -8,6 +8,7 @@ sys.path.append('.')
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 # Import CRUD routers
@@ -18,7 +19,8 @@ from routers.transfers import router as transfers_router
 app = FastAPI(
     title="🏦 Finance Garden API - CRUD Test",
     description="API de prueba para CRUD de pagos y transferencias (sin autenticación)",
-    version="1.0.0-crud-test"
+    version="1.0.0-crud-test",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Payments - Listar pagos contra una conexión simulada
+"""
+
+import sys
+sys.path.append('.')
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import routers.payments as payments
+from core.security import get_current_user
+from core.database import get_pg
+
+USER_ID = "11111111-1111-1111-1111-111111111111"
+ACCOUNT_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+
+
+def payment_row(payment_id: str, account_name: str = "Cuenta principal") -> dict:
+    """Payment row as returned by the joined list query"""
+    now = datetime(2025, 8, 1, 12, 0)
+    return {
+        "id": payment_id,
+        "user_id": USER_ID,
+        "description": "Factura de luz",
+        "amount": 45.5,
+        "currency": "USD",
+        "payment_method": "card",
+        "status": "pending",
+        "account_id": ACCOUNT_ID,
+        "account_name": account_name,
+        "recipient_name": None,
+        "recipient_account": None,
+        "category_id": None,
+        "category_name": None,
+        "scheduled_date": None,
+        "processed_date": None,
+        "reference": None,
+        "transaction_id": None,
+        "fees": 1.32,
+        "exchange_rate": None,
+        "notes": None,
+        "tags": [],
+        "created_at": now,
+        "updated_at": now
+    }
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection with a server-side cursor"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+    async def cursor(self, query, *args):
+        self.queries.append((query, args))
+        for row in self.rows:
+            yield row
+
+
+def build_client(connection: FakeConnection) -> TestClient:
+    """App with only the payments router, authenticated and on the fake connection"""
+    app = FastAPI()
+    app.include_router(payments.router, prefix="/api/v1/payments")
+
+    async def fake_pg():
+        yield connection
+
+    app.dependency_overrides[get_current_user] = lambda: {"id": USER_ID}
+    app.dependency_overrides[get_pg] = fake_pg
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_list_payments():
+    """GET /payments/ streams every row as one JSON array"""
+    connection = FakeConnection([payment_row("pay_1"), payment_row("pay_2", account_name=None)])
+    response = build_client(connection).get("/api/v1/payments/", params={"status": "pending"})
+
+    assert response.status_code == 200, response.text
+    listed = response.json()
+    assert [payment["id"] for payment in listed] == ["pay_1", "pay_2"]
+    assert listed[0]["account_name"] == "Cuenta principal"
+    assert listed[1]["account_name"] is None
+
+    # Filters are bound as parameters on the joined query
+    query, args = connection.queries[0]
+    assert query.startswith(payments.LIST_PAYMENTS_SQL)
+    assert "p.status = $2" in query
+    assert args[:2] == (USER_ID, "pending")
+
+
+def test_list_payments_empty():
+    """GET /payments/ returns an empty array when nothing matches"""
+    response = build_client(FakeConnection([])).get("/api/v1/payments/")
+
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+
+def test_list_payments_invalid_row():
+    """GET /payments/ fails with an error status, not a truncated body"""
+    response = build_client(FakeConnection([{"id": "pay_1"}])).get("/api/v1/payments/")
+
+    assert response.status_code == 500
+
+
+if __name__ == "__main__":
+    test_list_payments()
+    print("✅ Payment list test passed")
+    test_list_payments_empty()
+    print("✅ Empty payment list test passed")
+    test_list_payments_invalid_row()
+    print("✅ Invalid payment row test passed")
@@ -3,61 +3,227 @@
 🧪 Test Server - Versión simplificada para probar la API
 """
 
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
 import sys
+import time
 sys.path.append('.')
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+from datetime import datetime
+from functools import lru_cache
+from pydantic import BaseModel
+from typing import List, Optional
+import numpy as np
+import orjson
 import uvicorn
 
 
+# Configured before the router block below so its messages are emitted. Workers
+# spawned by uvicorn re-import this module; only the launcher logs startup info
+logger = logging.getLogger("finance_garden_api.test_server")
+logger.setLevel(logging.INFO if multiprocessing.current_process().name == "MainProcess" else logging.WARNING)
+logger.addHandler(logging.StreamHandler())
+logger.propagate = False
+
+WORKERS = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+
+# Kept local so the test server starts without the full app settings;
+# FG_CORS_ORIGINS overrides it with a comma-separated list
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv(
+        "FG_CORS_ORIGINS",
+        "http://localhost:3000,http://localhost:8080,http://localhost:8081,https://finance-garden.com"
+    ).split(",")
+    if origin.strip()
+]
+
+RATES_REFRESH_SECONDS = 60
+
+
+def _serialize_rates():
+    """Serialize the mock exchange rates with a fresh timestamp"""
+    now = datetime.utcnow().isoformat()
+    return orjson.dumps({
+        "status": "success",
+        "base_currency": "USD",
+        "rates": {
+            "MXN": 17.5234,
+            "EUR": 0.8542,
+            "COP": 4182.75
+        },
+        "timestamp": now,
+        "source": {
+            "provider": "Mock Exchange API",
+            "last_updated": now
+        }
+    })
+
+
+# Exchange rates payload, re-serialized in the background by refresh_rates()
+rates_bytes = _serialize_rates()
+
+
+async def refresh_rates():
+    """Keep rates_bytes fresh without touching the request path"""
+    global rates_bytes
+    while True:
+        await asyncio.sleep(RATES_REFRESH_SECONDS)
+        rates_bytes = _serialize_rates()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the rates refresher for the lifetime of the app"""
+    rates_task = asyncio.create_task(refresh_rates())
+    yield
+    rates_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await rates_task
+
+
 # Create simplified FastAPI app for testing
 app = FastAPI(
     title="🏦 Finance Garden API - Test Version",
     description="API de prueba para gestión financiera inteligente",
-    version="1.0.0-test"
+    version="1.0.0-test",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
+    max_age=86400,
 )
 
+# Compress larger JSON payloads (added last, so it wraps CORS)
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+
+def cache_headers(payload: bytes) -> dict:
+    """ETag and Cache-Control headers for a static payload"""
+    # Weak, since the same validator covers the gzip and identity encodings
+    return {
+        "ETag": f'W/"{hashlib.md5(payload).hexdigest()}"',
+        "Cache-Control": "public, max-age=60"
+    }
+
+
+class StaticResponse(Response):
+    """Response that can be shared across requests"""
+
+    async def __call__(self, scope, receive, send):
+        # GZipMiddleware edits the start message headers in place, so hand out a copy
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": list(self.raw_headers)
+        })
+        await send({"type": "http.response.body", "body": self.body})
+
+
+def static_responses(payload: bytes) -> tuple:
+    """Prebuilt (etag, 200 response, 304 response) for a static payload"""
+    headers = cache_headers(payload)
+    return (
+        headers["ETag"],
+        StaticResponse(content=payload, media_type="application/json", headers=headers),
+        StaticResponse(status_code=304, headers=headers)
+    )
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    opaque_tag = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque_tag:
+            return True
+    return False
+
+
+def static_json(request: Request, responses: tuple) -> Response:
+    """Serve a prebuilt static response, or 304 if the client already has it"""
+    etag, ok, not_modified = responses
+    return not_modified if etag_matches(request.headers.get("if-none-match"), etag) else ok
+
+
+# Mock handlers stay async def: none of them block, so Starlette runs them on the
+# loop without a threadpool hop. Anything that adds blocking I/O should become def.
+# Static mock payloads are serialized once at import, and their Response objects
+# are built once too and shared across requests
+ROOT_BYTES = orjson.dumps({
+    "message": "🏦 Finance Garden API is running!",
+    "version": "1.0.0-test",
+    "status": "healthy",
+    "docs": "/docs"
+})
+ROOT_RESPONSES = static_responses(ROOT_BYTES)
+
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint"""
-    return {
-        "message": "🏦 Finance Garden API is running!",
-        "version": "1.0.0-test",
-        "status": "healthy",
-        "docs": "/docs"
+    return static_json(request, ROOT_RESPONSES)
+
+
+HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "services": {
+        "api": "running",
+        "database": "not_configured",
+        "redis": "not_configured"
     }
+})
+HEALTH_RESPONSE = StaticResponse(content=HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "services": {
-            "api": "running",
-            "database": "not_configured",
-            "redis": "not_configured"
-        }
-    }
+    return HEALTH_RESPONSE
 
 
-# Import the CRUD routers
-try:
-    from routers.payments import router as payments_router
-    from routers.transfers import router as transfers_router
-    from routers.danger_zone import router as danger_zone_router
-    
+# Body-less answer for HEAD probes against / and /health
+HEAD_RESPONSE = StaticResponse(status_code=200, headers={"Cache-Control": "no-store"})
+
+
+@app.head("/")
+@app.head("/health")
+async def head_check():
+    """HEAD probe endpoint"""
+    return HEAD_RESPONSE
+
+
+# Import the CRUD routers (set FG_ENABLE_CRUD=0 to serve only the mock endpoints)
+CRUD_ENABLED = os.getenv("FG_ENABLE_CRUD", "1") == "1"
+
+if CRUD_ENABLED:
+    try:
+        from routers.payments import router as payments_router
+        from routers.transfers import router as transfers_router
+        from routers.danger_zone import router as danger_zone_router
+    except ImportError as e:
+        # The routers pull in asyncpg, supabase, etc.; keep serving the mocks without them
+        CRUD_ENABLED = False
+        logger.warning(f"⚠️ CRUD routers not available: {e}")
+
+if CRUD_ENABLED:
     # Include CRUD routers
     app.include_router(
         payments_router,
@@ -76,73 +242,88 @@ try:
         prefix="/api/v1/danger-zone", 
         tags=["🚨 Danger Zone"]
     )
-    print("✅ CRUD routers loaded successfully!")
-    print("🚨 Danger Zone router loaded!")
-    
-except ImportError as e:
-    print(f"⚠️ CRUD routers not available: {e}")
+    logger.info("✅ CRUD routers loaded successfully!")
+    logger.info("🚨 Danger Zone router loaded!")
 
 # Analytics endpoints (simplified)
+DASHBOARD_BYTES = orjson.dumps({
+    "status": "success",
+    "financial_health": {
+        "overall_score": 78,
+        "savings_ratio": 0.15,
+        "debt_to_income_ratio": 0.25
+    },
+    "expense_analytics": {
+        "total_expenses": {"amount": 2500.0, "currency": "USD"},
+        "categories": []
+    },
+    "income_analytics": {
+        "total_income": {"amount": 3500.0, "currency": "USD"},
+        "growth_rate": 0.05
+    }
+})
+DASHBOARD_RESPONSES = static_responses(DASHBOARD_BYTES)
+
+
 @app.get("/api/v1/analytics/dashboard")
-async def get_dashboard():
+async def get_dashboard(request: Request):
     """Mock financial dashboard"""
-    return {
-        "status": "success",
-        "financial_health": {
-            "overall_score": 78,
-            "savings_ratio": 0.15,
-            "debt_to_income_ratio": 0.25
-        },
-        "expense_analytics": {
-            "total_expenses": {"amount": 2500.0, "currency": "USD"},
-            "categories": []
-        },
-        "income_analytics": {
-            "total_income": {"amount": 3500.0, "currency": "USD"},
-            "growth_rate": 0.05
-        }
+    return static_json(request, DASHBOARD_RESPONSES)
+
+
+SPENDING_PATTERNS_BYTES = orjson.dumps({
+    "status": "success",
+    "message": "Spending patterns analyzed successfully",
+    "data": {
+        "patterns": [],
+        "anomalies": [],
+        "predictions": []
     }
+})
+SPENDING_PATTERNS_RESPONSES = static_responses(SPENDING_PATTERNS_BYTES)
 
 
 @app.get("/api/v1/analytics/spending-patterns")
-async def get_spending_patterns():
+async def get_spending_patterns(request: Request):
     """Mock spending patterns"""
-    return {
-        "status": "success",
-        "message": "Spending patterns analyzed successfully",
-        "data": {
-            "patterns": [],
-            "anomalies": [],
-            "predictions": []
-        }
-    }
+    return static_json(request, SPENDING_PATTERNS_RESPONSES)
 
 
-@app.get("/api/v1/analytics/cash-flow/predictions")
-async def predict_cash_flow():
-    """Mock cash flow predictions"""
-    from datetime import datetime, timedelta
-    
-    predictions = []
-    for i in range(3):
-        future_date = datetime.now().date() + timedelta(days=30 * (i + 1))
-        predictions.append({
-            "date": future_date.isoformat(),
+PREDICTION_MONTHS = 3
+
+
+@lru_cache(maxsize=1)
+def _predictions_for(today):
+    """Serialized cash flow predictions for the given day"""
+    dates = (np.datetime64(today, "D") + np.arange(1, PREDICTION_MONTHS + 1) * 30).astype(str)
+    return orjson.dumps([
+        {
+            "date": date,
             "predicted_income": {"amount": 3500.0, "currency": "USD"},
             "predicted_expenses": {"amount": 2800.0, "currency": "USD"},
             "predicted_balance": {"amount": 700.0, "currency": "USD"},
             "confidence_score": 0.85
-        })
-    
-    return predictions
+        }
+        for date in dates.tolist()
+    ])
 
 
-@app.get("/api/v1/analytics/insights")
-async def get_insights():
-    """Mock AI insights"""
-    from datetime import datetime
-    
-    insights = [
+@app.get("/api/v1/analytics/cash-flow/predictions")
+async def predict_cash_flow():
+    """Mock cash flow predictions"""
+    return Response(content=_predictions_for(datetime.now().date()), media_type="application/json")
+
+
+INSIGHTS_TTL_SECONDS = 30
+
+# (built_at, payload) on the monotonic clock; rebuilt lazily once stale
+insights_cache = (float("-inf"), b"")
+
+
+def _build_insights():
+    """Mock AI insights payload"""
+    now = datetime.utcnow()
+    return [
         {
             "title": "Oportunidad de Ahorro en Restaurantes",
             "description": "Has gastado 23% más en restaurantes este mes comparado con el promedio. Considera cocinar más en casa.",
@@ -151,7 +332,7 @@ async def get_insights():
             "action_required": False,
             "suggested_actions": ["Planificar menús semanales", "Buscar recetas fáciles"],
             "confidence_score": 0.85,
-            "created_at": datetime.utcnow()
+            "created_at": now
         },
         {
             "title": "Excedente de Ingresos Detectado",
@@ -161,81 +342,120 @@ async def get_insights():
             "action_required": True,
             "suggested_actions": ["Transferir a cuenta de ahorros", "Considerar inversión a corto plazo"],
             "confidence_score": 0.92,
-            "created_at": datetime.utcnow()
+            "created_at": now
         }
     ]
-    
-    return insights
+
+
+def insights_bytes() -> bytes:
+    """Serialized insights, refreshed at most every INSIGHTS_TTL_SECONDS"""
+    global insights_cache
+    now = time.monotonic()
+    if now - insights_cache[0] > INSIGHTS_TTL_SECONDS:
+        insights_cache = (now, orjson.dumps(_build_insights()))
+    return insights_cache[1]
+
+
+@app.get("/api/v1/analytics/insights")
+async def get_insights():
+    """Mock AI insights"""
+    return Response(content=insights_bytes(), media_type="application/json")
+
+
+AUTOMATION_RULE_BYTES = orjson.dumps({
+    "status": "success",
+    "message": "Automation rule created successfully",
+    "rule": {
+        "id": "rule_mock_123",
+        "name": "Auto-categorizar Uber",
+        "rule_type": "categorization",
+        "is_active": True
+    }
+})
+AUTOMATION_RULE_RESPONSE = StaticResponse(content=AUTOMATION_RULE_BYTES, media_type="application/json")
 
 
 @app.post("/api/v1/automation/rules")
 async def create_automation_rule():
     """Mock automation rule creation"""
-    return {
-        "status": "success",
-        "message": "Automation rule created successfully",
-        "rule": {
-            "id": "rule_mock_123",
-            "name": "Auto-categorizar Uber",
-            "rule_type": "categorization",
-            "is_active": True
+    return AUTOMATION_RULE_RESPONSE
+
+
+AUTOMATION_SUGGESTIONS_BYTES = orjson.dumps({
+    "status": "success",
+    "suggestions": [
+        {
+            "type": "categorization",
+            "title": "Auto-categorizar transacciones de Uber",
+            "description": "Detectamos que categorizas manualmente las transacciones de Uber. Podemos automatizar esto.",
+            "confidence": 0.95,
+            "estimated_savings": "5 minutos por mes"
+        },
+        {
+            "type": "transfer",
+            "title": "Transferencia automática a ahorros",
+            "description": "Basado en tus patrones, podrías ahorrar $300 más cada mes automáticamente.",
+            "confidence": 0.88,
+            "estimated_savings": "Ahorro adicional de $3,600/año"
         }
-    }
+    ],
+    "total": 2
+})
+AUTOMATION_SUGGESTIONS_RESPONSES = static_responses(AUTOMATION_SUGGESTIONS_BYTES)
 
 
 @app.get("/api/v1/automation/suggestions")
-async def get_automation_suggestions():
+async def get_automation_suggestions(request: Request):
     """Mock automation suggestions"""
-    return {
-        "status": "success",
-        "suggestions": [
-            {
-                "type": "categorization",
-                "title": "Auto-categorizar transacciones de Uber",
-                "description": "Detectamos que categorizas manualmente las transacciones de Uber. Podemos automatizar esto.",
-                "confidence": 0.95,
-                "estimated_savings": "5 minutos por mes"
-            },
-            {
-                "type": "transfer",
-                "title": "Transferencia automática a ahorros",
-                "description": "Basado en tus patrones, podrías ahorrar $300 más cada mes automáticamente.",
-                "confidence": 0.88,
-                "estimated_savings": "Ahorro adicional de $3,600/año"
-            }
-        ],
-        "total": 2
-    }
+    return static_json(request, AUTOMATION_SUGGESTIONS_RESPONSES)
 
 
 @app.get("/api/v1/integrations/exchange-rates")
 async def get_exchange_rates():
     """Mock exchange rates"""
-    return {
-        "status": "success",
-        "base_currency": "USD",
-        "rates": {
-            "MXN": 17.5234,
-            "EUR": 0.8542,
-            "COP": 4182.75
-        },
-        "timestamp": datetime.utcnow().isoformat(),
-        "source": {
-            "provider": "Mock Exchange API",
-            "last_updated": datetime.utcnow().isoformat()
-        }
-    }
+    return Response(content=rates_bytes, media_type="application/json")
+
+
+class BatchRequest(BaseModel):
+    requests: List[str]
+
+
+BATCH_PAYLOADS = {
+    "dashboard": lambda: DASHBOARD_BYTES,
+    "spending-patterns": lambda: SPENDING_PATTERNS_BYTES,
+    "insights": insights_bytes,
+    "exchange-rates": lambda: rates_bytes,
+}
+
+
+@app.post("/api/v1/analytics/batch")
+async def analytics_batch(batch: BatchRequest):
+    """Serve several analytics payloads in one round trip"""
+    names = list(dict.fromkeys(batch.requests))
+    unknown = [name for name in names if name not in BATCH_PAYLOADS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown batch requests: {', '.join(unknown)}")
+    
+    # Splice the preserialized fragments instead of re-encoding them
+    body = b",".join(orjson.dumps(name) + b":" + BATCH_PAYLOADS[name]() for name in names)
+    return Response(content=b'{"responses":{' + body + b"}}", media_type="application/json")
 
 
 if __name__ == "__main__":
-    print("🧪 Starting Finance Garden API Test Server...")
-    print("📚 Documentation: http://localhost:8000/docs")
-    print("🔄 Health check: http://localhost:8000/health")
-    print("=" * 50)
+    logger.info("🧪 Starting Finance Garden API Test Server...")
+    logger.info("📚 Documentation: http://localhost:8000/docs")
+    logger.info("🔄 Health check: http://localhost:8000/health")
     
+    # One worker per core (plus one) so CPU-bound mock handlers don't serialize
     uvicorn.run(
-        app,
+        "test_server:app",
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        workers=WORKERS,
+        loop="uvloop",
+        http="httptools",
+        backlog=4096,
+        server_header=False,
+        log_level="warning",
+        access_log=False
     )
\ No newline at end of file
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+🧪 Test Transfers - Crear transferencias contra una conexión simulada
+"""
+
+import sys
+sys.path.append('.')
+
+from contextlib import contextmanager
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import routers.transfers as transfers
+from core.security import get_current_user
+from core.database import get_pg, run_with_pg
+
+USER_ID = "11111111-1111-1111-1111-111111111111"
+FROM_ACCOUNT_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa6"
+TO_ACCOUNT_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa7"
+FOREIGN_ACCOUNT_ID = "3fa85f64-5717-4562-b3fc-2c963f66afa8"
+OWNED_ACCOUNT_IDS = {FROM_ACCOUNT_ID, TO_ACCOUNT_ID}
+
+
+class FakeConnection:
+    """Stands in for an asyncpg connection and records every statement"""
+
+    def __init__(self):
+        self.statements = []
+        self.inserted_rows = []
+
+    async def fetch(self, query, *args):
+        # Account lookups take the requested IDs as their last argument
+        self.statements.append(query)
+        return [
+            {"id": account_id, "user_id": USER_ID}
+            for account_id in args[-1] if account_id in OWNED_ACCOUNT_IDS
+        ]
+
+    async def execute(self, query, *args):
+        self.statements.append(query)
+        return "OK"
+
+    async def executemany(self, query, rows):
+        self.statements.append(query)
+        self.inserted_rows.extend(rows)
+
+
+def transfer_payload(description: str, from_account_id: str = FROM_ACCOUNT_ID) -> dict:
+    """Internal transfer request body"""
+    return {
+        "description": description,
+        "amount": 250.0,
+        "from_account_id": from_account_id,
+        "to_account_id": TO_ACCOUNT_ID,
+        "recipient_name": "Cuenta de ahorros",
+        "transfer_type": "internal"
+    }
+
+
+@contextmanager
+def build_client(connection: FakeConnection):
+    """App with only the transfers router, authenticated and on the fake connection"""
+    app = FastAPI()
+    app.include_router(transfers.router, prefix="/api/v1/transfers")
+
+    async def fake_pg():
+        yield connection
+
+    async def fake_run_with_pg(job, *args):
+        return await job(connection, *args)
+
+    app.dependency_overrides[get_current_user] = lambda: {"id": USER_ID}
+    app.dependency_overrides[get_pg] = fake_pg
+    # Background processing normally takes its own pooled connection;
+    # the module attribute is restored so other tests see the real helper
+    original_run_with_pg = transfers.run_with_pg
+    transfers.run_with_pg = fake_run_with_pg
+    try:
+        yield TestClient(app)
+    finally:
+        transfers.run_with_pg = original_run_with_pg
+
+
+def test_create_transfer():
+    """POST /transfers/ creates and persists one internal transfer"""
+    connection = FakeConnection()
+    with build_client(connection) as client:
+        response = client.post("/api/v1/transfers/", json=transfer_payload("Ahorro mensual"))
+
+    assert response.status_code == 201, response.text
+    transfer = response.json()
+    assert transfer["status"] == "pending"
+    assert transfer["from_account_id"] == FROM_ACCOUNT_ID
+    assert transfer["total_amount"] == 250.0
+
+    # Both accounts are verified in one batched query, then the row is inserted;
+    # processing is still a mock, so the status is never written
+    assert connection.statements[0] == transfers.GET_ACCOUNTS_BY_IDS_SQL
+    assert transfers.INSERT_TRANSFER_SQL in connection.statements
+    assert transfers.UPDATE_TRANSFER_STATUS_SQL not in connection.statements
+
+
+def test_bulk_transfers_partial_failure():
+    """POST /transfers/bulk inserts the valid items and reports the rejected ones"""
+    connection = FakeConnection()
+    with build_client(connection) as client:
+        response = client.post("/api/v1/transfers/bulk", json=[
+            transfer_payload("Ahorro mensual"),
+            transfer_payload("Cuenta ajena", from_account_id=FOREIGN_ACCOUNT_ID),
+            transfer_payload("Fondo de emergencia")
+        ])
+
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["status"] == "partial"
+    assert result["created"] == 2
+    assert result["errors"] == 1
+    assert result["error_details"][0]["index"] == 1
+    assert result["error_details"][0]["transfer_description"] == "Cuenta ajena"
+
+    # Only the valid transfers are inserted, together in one executemany
+    assert connection.statements.count(transfers.INSERT_TRANSFER_SQL) == 1
+    assert len(connection.inserted_rows) == 2
+
+    # The background-task patch does not outlive the client
+    assert transfers.run_with_pg is run_with_pg
+
+
+if __name__ == "__main__":
+    test_create_transfer()
+    print("✅ Transfer creation test passed")
+    test_bulk_transfers_partial_failure()
+    print("✅ Bulk transfer partial failure test passed")
@@ -419,6 +419,7 @@ export type Database = {
           description: string
           generate_tithe: boolean
           id: string
+          import_hash: string | null
           notes: string | null
           transaction_date: string
           type: Database["public"]["Enums"]["transaction_type"]
@@ -433,6 +434,7 @@ export type Database = {
           description: string
           generate_tithe?: boolean
           id?: string
+          import_hash?: string | null
           notes?: string | null
           transaction_date?: string
           type: Database["public"]["Enums"]["transaction_type"]
@@ -447,6 +449,7 @@ export type Database = {
           description?: string
           generate_tithe?: boolean
           id?: string
+          import_hash?: string | null
           notes?: string | null
           transaction_date?: string
           type?: Database["public"]["Enums"]["transaction_type"]
@@ -0,0 +1,15 @@
+-- Indexes backing the transfers API list and upcoming-schedule queries.
+-- Migrations run inside a transaction, so CONCURRENTLY is not available here;
+-- the tables are provisioned outside these migrations, hence the guard.
+DO $$
+BEGIN
+  IF to_regclass('public.transfers') IS NOT NULL THEN
+    CREATE INDEX IF NOT EXISTS transfers_user_status_amount_idx
+    ON public.transfers (user_id, status, amount)
+    WHERE status IS NOT NULL;
+
+    CREATE INDEX IF NOT EXISTS transfers_user_scheduled_date_idx
+    ON public.transfers (user_id, scheduled_date);
+  END IF;
+END
+$$;
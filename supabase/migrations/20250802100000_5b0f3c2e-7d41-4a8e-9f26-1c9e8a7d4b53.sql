@@ -0,0 +1,15 @@
+-- Dedup key for file imports: the import service fills import_hash from the
+-- account, date, amount and description of each row and upserts with
+-- on_conflict=user_id,import_hash. Rows created in the app keep a NULL hash,
+-- which never conflicts, so manually entered duplicates are still allowed.
+-- The table is provisioned outside these migrations, hence the guard.
+DO $$
+BEGIN
+  IF to_regclass('public.transactions') IS NOT NULL THEN
+    ALTER TABLE public.transactions ADD COLUMN IF NOT EXISTS import_hash text;
+
+    CREATE UNIQUE INDEX IF NOT EXISTS transactions_user_import_hash_key
+    ON public.transactions (user_id, import_hash);
+  END IF;
+END
+$$;